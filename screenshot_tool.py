@@ -10,15 +10,24 @@ Features:
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, simpledialog
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
 import subprocess
 import time
+import math
 import traceback
 import logging
+import platform
+import threading
+import concurrent.futures
+import re
+from array import array
+import importlib.util
+import ctypes
+from ctypes import wintypes
 
 # Set up crash logging
 log_dir = Path.home() / "Pictures" / "Screenshots"
@@ -29,47 +38,611 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-# Check and install required packages
+# Check and install required packages. pip can block for many seconds, so it
+# only runs when asked to: set SCREENSHOT_TOOL_AUTOINSTALL=1
+AUTOINSTALL = os.environ.get("SCREENSHOT_TOOL_AUTOINSTALL") == "1"
+
 def install_package(package):
-    subprocess.check_call([sys.executable, "-m", "pip", "install", package, "--quiet"])
+    if not AUTOINSTALL:
+        raise ImportError(f"{package} is not installed - run 'pip install {package}', "
+                          f"or set SCREENSHOT_TOOL_AUTOINSTALL=1 to let the tool install it")
+    print(f"Installing {package}...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet",
+                           "--disable-pip-version-check", "--no-input", package])
 
 try:
-    from PIL import Image, ImageTk, ImageGrab
+    from PIL import Image, ImageTk, ImageGrab, ImageDraw, ImageFont, ImageFilter, ImageChops, ImageStat
 except ImportError:
-    print("Installing Pillow...")
-    install_package("Pillow")
-    from PIL import Image, ImageTk, ImageGrab
+    # Pillow-SIMD is a drop-in Pillow with SSE4/AVX2 resize and composite loops.
+    # It only ships as source, so fall back to stock Pillow if the build fails.
+    installed = False
+    if AUTOINSTALL and platform.machine().lower() in ('amd64', 'x86_64'):
+        try:
+            install_package("pillow-simd")
+            installed = True
+        except subprocess.CalledProcessError:
+            print("Pillow-SIMD could not be installed, falling back to Pillow")
+    if not installed:
+        install_package("Pillow")
+    from PIL import Image, ImageTk, ImageGrab, ImageDraw, ImageFont, ImageFilter, ImageChops, ImageStat
+
+# mss and pyautogui are only needed on fallback / scrolling paths and pyautogui
+# alone pulls in a pile of modules, so make sure they're installed without
+# importing them here - the code that uses them imports on first use
+for package in ("mss", "pyautogui"):
+    if importlib.util.find_spec(package) is None:
+        install_package(package)
+
+# Pillow-SIMD installs as "Pillow" but with a .postN version suffix
+import PIL
+PILLOW_SIMD = ".post" in PIL.__version__
 
+# Optional: Virtual desktop support
 try:
-    import keyboard
+    from pyvda import AppView, VirtualDesktop
+    PYVDA_AVAILABLE = True
 except ImportError:
-    print("Installing keyboard...")
-    install_package("keyboard")
-    import keyboard
+    PYVDA_AVAILABLE = False
 
+# Optional: DXGI Desktop Duplication capture (pip install bettercam)
 try:
-    import mss
+    import bettercam
+    BETTERCAM_AVAILABLE = True
 except ImportError:
-    print("Installing mss...")
-    install_package("mss")
-    import mss
+    BETTERCAM_AVAILABLE = False
+
+
+def screenshot_to_image(screenshot):
+    """Convert an mss grab to an RGB PIL image.
+
+    Decodes straight from the grab's raw buffer - the .bgra property would
+    first copy the whole frame into a new bytes object.
+    """
+    return Image.frombuffer("RGB", screenshot.size, screenshot.raw, "raw", "BGRX", 0, 1)
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", wintypes.DWORD),
+        ("biWidth", wintypes.LONG),
+        ("biHeight", wintypes.LONG),
+        ("biPlanes", wintypes.WORD),
+        ("biBitCount", wintypes.WORD),
+        ("biCompression", wintypes.DWORD),
+        ("biSizeImage", wintypes.DWORD),
+        ("biXPelsPerMeter", wintypes.LONG),
+        ("biYPelsPerMeter", wintypes.LONG),
+        ("biClrUsed", wintypes.DWORD),
+        ("biClrImportant", wintypes.DWORD),
+    ]
+
+
+class BITMAPV5HEADER(ctypes.Structure):
+    _fields_ = BITMAPINFOHEADER._fields_ + [
+        ("bV5RedMask", wintypes.DWORD),
+        ("bV5GreenMask", wintypes.DWORD),
+        ("bV5BlueMask", wintypes.DWORD),
+        ("bV5AlphaMask", wintypes.DWORD),
+        ("bV5CSType", wintypes.DWORD),
+        ("bV5Endpoints", wintypes.LONG * 9),  # CIEXYZTRIPLE
+        ("bV5GammaRed", wintypes.DWORD),
+        ("bV5GammaGreen", wintypes.DWORD),
+        ("bV5GammaBlue", wintypes.DWORD),
+        ("bV5Intent", wintypes.DWORD),
+        ("bV5ProfileData", wintypes.DWORD),
+        ("bV5ProfileSize", wintypes.DWORD),
+        ("bV5Reserved", wintypes.DWORD),
+    ]
+
+
+class GdiSurface:
+    """One thread's screen DC, memory DC and DIB section for GdiCapture"""
+
+    def __init__(self, user32, gdi32):
+        self.user32 = user32
+        self.gdi32 = gdi32
+        self.screen_dc = user32.GetDC(None)
+        self.mem_dc = gdi32.CreateCompatibleDC(self.screen_dc)
+        self.bitmap = None
+        self.buffer = None
+        self.width = 0
+        self.height = 0
+
+    def allocate(self, width, height):
+        """(Re)create the DIB section the screen is blitted into"""
+        header = BITMAPINFOHEADER()
+        header.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        header.biWidth = width
+        header.biHeight = -height  # Negative = top-down rows, the order PIL expects
+        header.biPlanes = 1
+        header.biBitCount = 32
+        bits = ctypes.c_void_p()
+        bitmap = self.gdi32.CreateDIBSection(self.mem_dc, ctypes.byref(header), 0,
+                                             ctypes.byref(bits), None, 0)
+        if not bitmap:
+            raise ctypes.WinError()
+        self.gdi32.SelectObject(self.mem_dc, bitmap)
+        if self.bitmap:
+            self.gdi32.DeleteObject(self.bitmap)
+        self.bitmap = bitmap
+        self.buffer = (ctypes.c_char * (width * height * 4)).from_address(bits.value)
+        self.width = width
+        self.height = height
+
+    def __del__(self):
+        # Runs when the owning thread exits (its threading.local is dropped)
+        try:
+            if self.bitmap:
+                self.gdi32.DeleteObject(self.bitmap)
+            self.gdi32.DeleteDC(self.mem_dc)
+            self.user32.ReleaseDC(None, self.screen_dc)
+        except Exception:
+            pass
+
+
+class GdiCapture:
+    """Screen capture with a GDI BitBlt into a reusable DIB section.
+
+    The DIB is only reallocated when a grab is bigger than any before it, so
+    repeat captures cost one BitBlt plus the BGRX -> RGB decode - no per-shot
+    bitmap, DC or buffer allocations like a fresh mss instance makes.
+    GDI handles shouldn't be shared between threads, so each thread that grabs
+    gets its own DCs and DIB.
+    """
+
+    SRCCOPY = 0x00CC0020
+    BLACKNESS = 0x00000042
+    CAPTUREBLT = 0x40000000  # Include layered (translucent) windows
+    PW_RENDERFULLCONTENT = 0x2  # PrintWindow flag that also captures DirectComposition content
+    SM_CXSCREEN, SM_CYSCREEN = 0, 1
+    SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN = 76, 77
+    SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN = 78, 79
+
+    def __init__(self):
+        # Private WinDLL handles so the argtypes below don't leak into other ctypes users
+        self.user32 = ctypes.WinDLL('user32')
+        self.gdi32 = ctypes.WinDLL('gdi32')
+        self.user32.GetDC.argtypes = [wintypes.HWND]
+        self.user32.GetDC.restype = wintypes.HDC
+        self.user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+        self.gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+        self.gdi32.CreateCompatibleDC.restype = wintypes.HDC
+        self.gdi32.CreateDIBSection.argtypes = [
+            wintypes.HDC, ctypes.POINTER(BITMAPINFOHEADER), wintypes.UINT,
+            ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD]
+        self.gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+        self.gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+        self.gdi32.SelectObject.restype = wintypes.HGDIOBJ
+        self.gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+        self.gdi32.DeleteDC.argtypes = [wintypes.HDC]
+        self.gdi32.BitBlt.argtypes = [
+            wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD]
+        self.gdi32.PatBlt.argtypes = [
+            wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.DWORD]
+        self.user32.PrintWindow.argtypes = [wintypes.HWND, wintypes.HDC, wintypes.UINT]
+        self.user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+
+        # Physical pixel coordinates on scaled displays. System-aware, as when
+        # pyautogui was imported at startup - per-monitor awareness would stop
+        # Windows rescaling the Tk windows on a monitor with a different DPI
+        self.user32.SetProcessDPIAware()
+
+        self.local = threading.local()
+
+    def surface(self):
+        """This thread's GdiSurface, created on its first grab"""
+        surface = getattr(self.local, 'surface', None)
+        if surface is None:
+            surface = self.local.surface = GdiSurface(self.user32, self.gdi32)
+        return surface
+
+    def monitor(self, index):
+        """mss-style monitor dict: 0 = all monitors, 1 = primary"""
+        # Read per grab (cheap) - a cached box goes stale when displays change
+        metric = self.user32.GetSystemMetrics
+        if index == 0:
+            return {"left": metric(self.SM_XVIRTUALSCREEN), "top": metric(self.SM_YVIRTUALSCREEN),
+                    "width": metric(self.SM_CXVIRTUALSCREEN), "height": metric(self.SM_CYVIRTUALSCREEN)}
+        return {"left": 0, "top": 0,
+                "width": metric(self.SM_CXSCREEN), "height": metric(self.SM_CYSCREEN)}
+
+    def grab(self, left, top, width, height):
+        """Capture a screen rectangle as an RGB image"""
+        surface = self.surface()
+        if width > surface.width or height > surface.height:
+            surface.allocate(max(width, surface.width), max(height, surface.height))
+        if not self.gdi32.BitBlt(surface.mem_dc, 0, 0, width, height, surface.screen_dc,
+                                 left, top, self.SRCCOPY | self.CAPTUREBLT):
+            raise ctypes.WinError()
+        # Rows in the DIB are surface.width pixels apart; the decode copies
+        # the pixels out, so the buffer is free for the next grab.
+        # RGB, not RGBA: an always-opaque alpha only slows the PNG encode
+        return Image.frombuffer("RGB", (width, height), surface.buffer,
+                                "raw", "BGRX", surface.width * 4, 1)
+
+    def grab_window(self, hwnd, left, top, width, height):
+        """Have a window render itself (even if covered), returning the given screen
+        rectangle of it as an RGB image. Returns None if it draws nothing."""
+        rect = wintypes.RECT()
+        if not self.user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+            return None
+        x, y = left - rect.left, top - rect.top
+        if x < 0 or y < 0 or x + width > rect.right - rect.left or y + height > rect.bottom - rect.top:
+            return None  # Moved or resized since the rectangle was taken
+        win_w, win_h = rect.right - rect.left, rect.bottom - rect.top
+
+        surface = self.surface()
+        if win_w > surface.width or win_h > surface.height:
+            surface.allocate(max(win_w, surface.width), max(win_h, surface.height))
+        # Clear out the previous grab so a window that doesn't paint reads as blank
+        self.gdi32.PatBlt(surface.mem_dc, 0, 0, win_w, win_h, self.BLACKNESS)
+        if not self.user32.PrintWindow(hwnd, surface.mem_dc, self.PW_RENDERFULLCONTENT):
+            return None
+        # Decode just the requested part (e.g. without the invisible resize borders)
+        offset = (y * surface.width + x) * 4
+        img = Image.frombuffer("RGB", (width, height), memoryview(surface.buffer)[offset:],
+                               "raw", "BGRX", surface.width * 4, 1)
+        if img.getbbox() is None:
+            return None
+        return img
 
-try:
-    import pyautogui
-    import pygetwindow as gw
-except ImportError:
-    print("Installing pyautogui and pygetwindow...")
-    install_package("pyautogui")
-    install_package("pygetwindow")
-    import pyautogui
-    import pygetwindow as gw
 
-# Optional: Virtual desktop support
 try:
-    from pyvda import AppView, VirtualDesktop
-    PYVDA_AVAILABLE = True
-except ImportError:
-    PYVDA_AVAILABLE = False
+    gdi_capture = GdiCapture()
+except Exception:
+    # Not on Windows (or GDI unavailable) - grab_screen falls back to mss
+    gdi_capture = None
+
+# mss fallback instances, one per thread (an mss instance must stay on its thread)
+mss_local = threading.local()
+
+# Shared bettercam camera (primary display only), created on first use
+dxgi_camera = None
+dxgi_lock = threading.Lock()
+
+
+def grab_dxgi(left, top, width, height):
+    """Capture a primary-display rectangle with DXGI Desktop Duplication.
+
+    Returns None when it can't help: the box leaves the primary display, or
+    nothing has been redrawn since the last grab (duplication only hands out
+    changed frames) - the caller then falls back to GDI.
+    """
+    global dxgi_camera, BETTERCAM_AVAILABLE
+    with dxgi_lock:
+        if dxgi_camera is None:
+            try:
+                dxgi_camera = bettercam.create(output_color="BGRA")
+            except Exception as e:
+                print(f"Desktop Duplication unavailable, using GDI: {e}")
+                BETTERCAM_AVAILABLE = False
+                return None
+        if left < 0 or top < 0 or left + width > dxgi_camera.width or top + height > dxgi_camera.height:
+            return None
+        frame = dxgi_camera.grab(region=(left, top, left + width, top + height))
+    if frame is None:
+        return None
+    # Region grabs are strided views into the full frame; those go through a copy
+    data = frame if frame.flags['C_CONTIGUOUS'] else frame.tobytes()
+    return Image.frombuffer("RGB", (width, height), data, "raw", "BGRX", 0, 1)
+
+
+def grab_screen(monitor):
+    """Capture an RGB image of an mss-style monitor dict or index (0 = all, 1 = primary)"""
+    if gdi_capture is not None:
+        if isinstance(monitor, int):
+            monitor = gdi_capture.monitor(monitor)
+        if BETTERCAM_AVAILABLE:
+            img = grab_dxgi(monitor["left"], monitor["top"], monitor["width"], monitor["height"])
+            if img is not None:
+                return img
+        return gdi_capture.grab(monitor["left"], monitor["top"],
+                                monitor["width"], monitor["height"])
+    # Keep the instance open - creating one reconnects to the display server
+    sct = getattr(mss_local, 'sct', None)
+    if sct is None:
+        import mss
+        sct = mss_local.sct = mss.mss()
+    if isinstance(monitor, int):
+        monitor = sct.monitors[monitor]
+    return screenshot_to_image(sct.grab(monitor))
+
+
+def grab_window(hwnd, monitor, settle=0):
+    """Capture a window's screen rectangle (an mss-style dict).
+
+    The window renders itself where it can, so anything overlapping it stays
+    out of the shot and there's no wait for it to come to the front. Otherwise
+    the screen area is grabbed after waiting settle seconds.
+    """
+    if gdi_capture is not None:
+        img = gdi_capture.grab_window(hwnd, monitor["left"], monitor["top"],
+                                      monitor["width"], monitor["height"])
+        if img is not None:
+            return img
+    if settle:
+        time.sleep(settle)
+    return grab_screen(monitor)
+
+
+def release_capture():
+    """Free the calling thread's cached capture handles (GDI surface / mss instance),
+    and the shared Desktop Duplication camera"""
+    global dxgi_camera
+    if gdi_capture is not None:
+        gdi_capture.local.surface = None
+    with dxgi_lock:
+        if dxgi_camera is not None:
+            dxgi_camera.release()
+            dxgi_camera = None
+    sct = getattr(mss_local, 'sct', None)
+    if sct is not None:
+        mss_local.sct = None
+        sct.close()
+
+
+def image_to_dib(img):
+    """Pack an image as a CF_DIB clipboard block (24-bit, bottom-up rows).
+    Returns the header and pixel bytes separately - see clipboard_memory."""
+    # RGBA/RGBX pack straight to BGR (dropping the 4th byte) - no converted copy
+    if img.mode not in ('RGB', 'RGBA', 'RGBX'):
+        img = img.convert('RGB')
+    width, height = img.size
+    stride = (width * 3 + 3) & ~3  # DIB rows are padded to 4 bytes
+    # The raw encoder writes BGR rows bottom-up with the padding in one pass -
+    # no BMP file writer, BytesIO buffer or header-stripping copy.
+    # 24-bit: some apps read the X byte of a 32-bit CF_DIB as alpha
+    pixels = img.tobytes("raw", ("BGR", stride, -1))
+    header = BITMAPINFOHEADER()
+    header.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+    header.biWidth = width
+    header.biHeight = height
+    header.biPlanes = 1
+    header.biBitCount = 24
+    header.biSizeImage = len(pixels)
+    return bytes(header), pixels
+
+
+def has_alpha(img):
+    """True if the image carries transparency worth keeping on the clipboard"""
+    return img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+
+
+def image_to_dibv5(img):
+    """Pack an image as a CF_DIBV5 clipboard block (32-bit BGRA, bottom-up rows).
+    Returns the header and pixel bytes separately - see clipboard_memory."""
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    width, height = img.size
+    pixels = img.tobytes("raw", "BGRA", 0, -1)  # 4-byte pixels need no row padding
+    header = BITMAPV5HEADER()
+    header.biSize = ctypes.sizeof(BITMAPV5HEADER)
+    header.biWidth = width
+    header.biHeight = height
+    header.biPlanes = 1
+    header.biBitCount = 32
+    header.biCompression = 3  # BI_BITFIELDS
+    header.biSizeImage = len(pixels)
+    header.bV5RedMask = 0x00FF0000
+    header.bV5GreenMask = 0x0000FF00
+    header.bV5BlueMask = 0x000000FF
+    header.bV5AlphaMask = 0xFF000000
+    header.bV5CSType = 0x73524742  # LCS_sRGB
+    header.bV5Intent = 4  # LCS_GM_IMAGES
+    return bytes(header), pixels
+
+
+def clipboard_memory(*parts):
+    """Copy byte strings end to end into a new global memory block for SetClipboardData.
+
+    Handing pywin32 bytes makes it copy them into a global block itself, so
+    joining header and pixels first would copy the whole frame twice.
+    """
+    GMEM_MOVEABLE = 0x0002
+    kernel32 = ctypes.WinDLL('kernel32')  # Private handle - argtypes stay local
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+
+    handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, sum(len(part) for part in parts))
+    if not handle:
+        raise ctypes.WinError()
+    address = kernel32.GlobalLock(handle)
+    for part in parts:
+        ctypes.memmove(address, part, len(part))
+        address += len(part)
+    kernel32.GlobalUnlock(handle)
+    return handle
+
+
+def free_clipboard_memory(handle):
+    """Free a clipboard_memory block the clipboard didn't take ownership of"""
+    kernel32 = ctypes.WinDLL('kernel32')
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree(handle)
+
+
+def union_bbox(a, b):
+    """Smallest box covering two (x1, y1, x2, y2) boxes; either may be None"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def list_images(*folders):
+    """(mtime, path) for every PNG directly inside the given folders.
+
+    os.scandir entries carry the stat data from the directory listing itself on
+    Windows, so this is one directory read per folder rather than a stat per file.
+    """
+    images = []
+    for folder in folders:
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.name.lower().endswith('.png') and entry.is_file():
+                        images.append((entry.stat().st_mtime, Path(entry.path)))
+        except OSError:
+            pass  # Folder deleted or renamed meanwhile
+    return images
+
+
+def screenshot_entries(folder):
+    """os.DirEntry for each screenshot_*.png the tool saved directly into folder.
+    Their stat() is served from the directory listing on Windows."""
+    with os.scandir(folder) as it:
+        return [entry for entry in it
+                if entry.name.startswith("screenshot_")
+                and entry.name.lower().endswith(".png") and entry.is_file()]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+    ]
+
+
+class INPUT(ctypes.Structure):
+    class _INPUT(ctypes.Union):
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUT)]
+
+
+def send_inputs(inputs):
+    """Inject a batch of INPUT events with a single SendInput call"""
+    batch = (INPUT * len(inputs))(*inputs)
+    sent = ctypes.windll.user32.SendInput(len(inputs), batch, ctypes.sizeof(INPUT))
+    if sent != len(inputs):
+        raise ctypes.WinError()
+
+
+def key_input(vk, up=False):
+    """INPUT for one virtual-key press or release"""
+    event = INPUT(type=1)  # INPUT_KEYBOARD
+    event.ki.wVk = vk
+    event.ki.dwFlags = 0x0002 if up else 0  # KEYEVENTF_KEYUP
+    return event
+
+
+def send_ctrl_v():
+    """Press Ctrl+V as one atomic batch - nothing can interleave with the chord"""
+    VK_CONTROL, VK_V = 0x11, 0x56
+    send_inputs([key_input(VK_CONTROL), key_input(VK_V),
+                 key_input(VK_V, up=True), key_input(VK_CONTROL, up=True)])
+
+
+def click_at(x, y):
+    """Left-click at screen coordinates"""
+    ctypes.windll.user32.SetCursorPos(x, y)
+    down = INPUT(type=0)  # INPUT_MOUSE
+    down.mi.dwFlags = 0x0002  # MOUSEEVENTF_LEFTDOWN
+    up = INPUT(type=0)
+    up.mi.dwFlags = 0x0004  # MOUSEEVENTF_LEFTUP
+    send_inputs([down, up])
+
+
+class HotkeyListener:
+    """Global hotkeys via the Win32 RegisterHotKey API.
+
+    Windows matches the chord itself and posts WM_HOTKEY to a listener thread
+    that sleeps in GetMessageW, so unrelated keystrokes never reach Python.
+    Callbacks run on that thread, so UI work must be handed to Tk via after().
+    """
+
+    MODIFIERS = {'alt': 0x0001, 'ctrl': 0x0002, 'shift': 0x0004, 'win': 0x0008}
+    MOD_NOREPEAT = 0x4000  # Holding the chord down fires once, not on auto-repeat
+    WM_QUIT = 0x0012
+    WM_HOTKEY = 0x0312
+    WM_USER = 0x0400
+
+    def __init__(self, bindings):
+        # bindings: {"ctrl+shift+s": callback, ...}
+        self.bindings = bindings
+        self.callbacks = {}
+        self.failed = []
+        self.thread_id = None
+        self.ready = threading.Event()
+
+    @classmethod
+    def parse_hotkey(cls, hotkey):
+        """Turn "ctrl+shift+s" into RegisterHotKey (modifiers, virtual-key) values"""
+        modifiers = 0
+        vk = None
+        for part in hotkey.lower().split('+'):
+            if part in cls.MODIFIERS:
+                modifiers |= cls.MODIFIERS[part]
+            elif len(part) == 1 and part.isalnum():
+                vk = ord(part.upper())  # VK codes for A-Z / 0-9 are their ASCII codes
+            else:
+                raise ValueError(f"Unsupported hotkey key: {part}")
+        if vk is None:
+            raise ValueError(f"Hotkey has no key: {hotkey}")
+        return modifiers, vk
+
+    def start(self):
+        """Register the hotkeys; returns the ones Windows refused (already taken)"""
+        threading.Thread(target=self._run, daemon=True).start()
+        self.ready.wait(2)
+        return self.failed
+
+    def stop(self):
+        """Unregister the hotkeys and end the listener thread"""
+        if self.thread_id is not None:
+            ctypes.windll.user32.PostThreadMessageW(self.thread_id, self.WM_QUIT, 0, 0)
+            self.thread_id = None
+
+    def _run(self):
+        user32 = ctypes.windll.user32
+        msg = wintypes.MSG()
+        # Make sure this thread has a message queue before anyone posts to it
+        user32.PeekMessageW(ctypes.byref(msg), None, self.WM_USER, self.WM_USER, 0)
+        self.thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+
+        # Hotkeys registered without a window belong to the registering thread
+        for hotkey_id, (hotkey, callback) in enumerate(self.bindings.items(), 1):
+            try:
+                modifiers, vk = self.parse_hotkey(hotkey)
+            except ValueError as e:
+                print(e)
+                self.failed.append(hotkey)
+                continue
+            if user32.RegisterHotKey(None, hotkey_id, modifiers | self.MOD_NOREPEAT, vk):
+                self.callbacks[hotkey_id] = callback
+            else:
+                self.failed.append(hotkey)
+        self.ready.set()
+
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            if msg.message == self.WM_HOTKEY and msg.wParam in self.callbacks:
+                try:
+                    self.callbacks[msg.wParam]()
+                except Exception as e:
+                    print(f"Hotkey callback error: {e}")
+
+        for hotkey_id in self.callbacks:
+            user32.UnregisterHotKey(None, hotkey_id)
 
 
 class DelayCountdown:
@@ -77,6 +650,9 @@ class DelayCountdown:
 
     def __init__(self, seconds, callback):
         self.seconds_left = seconds
+        # Ticks are timed against a fixed deadline so late ones don't push the capture back
+        self.deadline = time.monotonic() + seconds
+        self.tick_after = None
         self.callback = callback
 
         # Create small floating window
@@ -132,23 +708,28 @@ class DelayCountdown:
         self.tick()
 
     def tick(self):
-        if self.seconds_left <= 0:
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
             self.window.destroy()
             self.callback(True)  # Capture now
             return
+        self.seconds_left = math.ceil(remaining)
 
-        self.label.config(text=str(self.seconds_left))
-
-        # Change color as countdown progresses
+        # Change color as countdown progresses (one config call = one relayout)
         if self.seconds_left <= 2:
-            self.label.config(fg='#ff5555')  # Red for last 2 seconds
+            self.label.config(text=str(self.seconds_left), fg='#ff5555')  # Red for last 2 seconds
         elif self.seconds_left <= 3:
-            self.label.config(fg='#ffaa00')  # Orange
+            self.label.config(text=str(self.seconds_left), fg='#ffaa00')  # Orange
+        else:
+            self.label.config(text=str(self.seconds_left))
 
-        self.seconds_left -= 1
-        self.window.after(1000, self.tick)
+        # Next tick when the displayed number runs out
+        delay = int((remaining - (self.seconds_left - 1)) * 1000)
+        self.tick_after = self.window.after(max(10, delay), self.tick)
 
     def cancel(self):
+        if self.tick_after is not None:
+            self.window.after_cancel(self.tick_after)
         self.window.destroy()
         self.callback(False)  # Cancelled
 
@@ -207,13 +788,12 @@ class WindowSelector:
         # Get screen coordinates
         x, y = event.x_root, event.y_root
 
-        # Close our overlays
+        # Close our overlays. destroy() ends in a synchronous DestroyWindow, so
+        # WindowFromPoint below can't hit them - no need to wait. The capture
+        # itself waits for the screen to repaint (settle) on the capture thread.
         self.overlay.destroy()
         self.info_window.destroy()
 
-        # Small delay to ensure overlay is gone
-        time.sleep(0.1)
-
         # Get the window at this position
         hwnd = win32gui.WindowFromPoint((x, y))
 
@@ -239,9 +819,12 @@ class WindowSelector:
 class ScrollingCapture:
     """Captures a scrollable window by auto-detecting and capturing the scrolling region"""
 
-    def __init__(self, hwnd, callback, scroll_delay=0.2, max_iterations=50):
+    def __init__(self, hwnd, callback, scroll_delay=0.2, max_iterations=50, capture_executor=None):
         self.hwnd = hwnd
         self.callback = callback
+        # Grabs go through the app's capture thread when given one, reusing its
+        # warm GDI surface / mss instance instead of building a second set here
+        self.capture_executor = capture_executor
         self.scroll_delay = scroll_delay
         self.max_iterations = max_iterations
         self.screenshots = []
@@ -308,6 +891,7 @@ class ScrollingCapture:
         """Main capture loop with auto-detection of scrollable region"""
         import win32gui
         import win32con
+        import pyautogui
 
         try:
             # Get window rect
@@ -426,13 +1010,12 @@ class ScrollingCapture:
             self.cancel()
 
     def capture_region(self, left, top, width, height):
-        """Capture a screen region using mss"""
+        """Capture a screen region"""
+        monitor = {"top": top, "left": left, "width": width, "height": height}
         try:
-            with mss.mss() as sct:
-                monitor = {"top": top, "left": left, "width": width, "height": height}
-                screenshot = sct.grab(monitor)
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-                return img
+            if self.capture_executor is not None:
+                return self.capture_executor.submit(grab_screen, monitor).result()
+            return grab_screen(monitor)
         except Exception as e:
             print(f"Error capturing region: {e}")
             return None
@@ -440,7 +1023,6 @@ class ScrollingCapture:
     def detect_scrollable_region(self, img1, img2):
         """Detect which region changed between two captures (that's the scrollable area)"""
         try:
-            from PIL import ImageChops, ImageStat
 
             if img1.size != img2.size:
                 return None
@@ -483,7 +1065,6 @@ class ScrollingCapture:
     def is_identical(self, img1, img2):
         """Detect if page actually scrolled by finding matching content between images"""
         try:
-            from PIL import ImageChops, ImageStat
 
             if img1.size != img2.size:
                 return False
@@ -546,7 +1127,6 @@ class ScrollingCapture:
                     crop2 = crop2.resize(crop1.size)
 
                 # Compare
-                from PIL import ImageChops, ImageStat
                 diff = ImageChops.difference(crop1, crop2)
                 stat = ImageStat.Stat(diff)
 
@@ -603,21 +1183,32 @@ class ScrollingCapture:
         return result
 
 
+# Per-channel table for darkening an RGB image as if (0, 0, 0, 128) were composited over it
+DIM_LUT = [(v * 127 + 127) // 255 for v in range(256)] * 3
+
+# Gallery thumbnail size for each thumbnail scale setting (1-10), from 120x90 at 5:
+# scale 1 = 50%, scale 5 = 100%, scale 10 = 300%
+THUMBNAIL_SIZES = [(int(120 * f), int(90 * f)) for f in
+                   [0.5 + (scale - 1) * 0.5 / 4 for scale in range(1, 6)] +
+                   [1.0 + (scale - 5) * 2.0 / 5 for scale in range(6, 11)]]
+
+
 class RegionSelector:
     """Fullscreen overlay for selecting a screen region - captures screen first"""
 
-    def __init__(self, callback):
+    def __init__(self, callback, captured_image=None, dimmed=None):
+        """captured_image / dimmed: the primary monitor grab and its dimmed backdrop,
+        if already made off the Tk thread (see ScreenshotTool._show_region_selector)"""
         self.callback = callback
         self.start_x = None
         self.start_y = None
+        self.end = None  # Corner the selection rectangle was last drawn to
         self.rect = None
 
         # FIRST: Capture the screen before showing any overlay
-        with mss.mss() as sct:
-            # Capture the primary monitor
-            monitor = sct.monitors[1]  # Primary monitor
-            screenshot = sct.grab(monitor)
-            self.captured_image = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+        if captured_image is None:
+            captured_image = grab_screen(1)  # Primary monitor
+        self.captured_image = captured_image
 
         # Create fullscreen window
         self.overlay = tk.Toplevel()
@@ -629,13 +1220,11 @@ class RegionSelector:
         screen_width = self.overlay.winfo_screenwidth()
         screen_height = self.overlay.winfo_screenheight()
 
-        # Create a dimmed version of the captured image for the overlay
-        dimmed = self.captured_image.copy()
-        # Apply dark overlay effect
-        dark_overlay = Image.new('RGBA', dimmed.size, (0, 0, 0, 128))
-        dimmed = dimmed.convert('RGBA')
-        dimmed = Image.alpha_composite(dimmed, dark_overlay)
-        dimmed = dimmed.convert('RGB')
+        # Create a dimmed version of the captured image for the overlay - a lookup
+        # table gives the same pixels as compositing 50% black over it, in one pass
+        # without the copy / RGBA / composite / RGB intermediates
+        if dimmed is None:
+            dimmed = self.captured_image.point(DIM_LUT)
 
         # Convert to PhotoImage for tkinter
         self.bg_photo = ImageTk.PhotoImage(dimmed)
@@ -675,6 +1264,7 @@ class RegionSelector:
     def on_press(self, event):
         self.start_x = event.x
         self.start_y = event.y
+        self.end = (event.x, event.y)
         # Create rectangle with red outline
         self.rect = self.canvas.create_rectangle(
             self.start_x, self.start_y,
@@ -684,7 +1274,11 @@ class RegionSelector:
         )
 
     def on_drag(self, event):
-        if self.rect:
+        # Moving the item makes the canvas repaint its whole box (backdrop included)
+        # on the next idle, so only do it when the corner actually moved - Windows
+        # also sends motion events for the same spot, e.g. when a window repaints
+        if self.rect and (event.x, event.y) != self.end:
+            self.end = (event.x, event.y)
             self.canvas.coords(
                 self.rect,
                 self.start_x, self.start_y,
@@ -701,21 +1295,27 @@ class RegionSelector:
         x2 = max(self.start_x, event.x)
         y2 = max(self.start_y, event.y)
 
-        # Close overlay
-        self.overlay.destroy()
+        # Crop from the PRE-CAPTURED image (no overlay in it!)
+        cropped = self.captured_image.crop((x1, y1, x2, y2))
+        self.close()
 
         # Check if region is valid (at least 10x10 pixels)
         if x2 - x1 > 10 and y2 - y1 > 10:
-            # Crop from the PRE-CAPTURED image (no overlay in it!)
-            cropped = self.captured_image.crop((x1, y1, x2, y2))
             self.callback((x1, y1, x2, y2), cropped)
         else:
             self.callback(None, None)
 
     def on_cancel(self, event):
-        self.overlay.destroy()
+        self.close()
         self.callback(None, None)
 
+    def close(self):
+        """Close the overlay and let go of the full-screen grab and backdrop photo now -
+        the callback may open the editor while this object is still referenced"""
+        self.overlay.destroy()
+        self.bg_photo = None
+        self.captured_image = None
+
 
 class ScreenshotEditor:
     """Editor window for highlighting screenshots before saving"""
@@ -728,13 +1328,15 @@ class ScreenshotEditor:
         'red': (255, 0, 0, 100),
     }
 
-    def __init__(self, image, callback):
+    # Text font by pixel size - shared, so reopening the editor doesn't re-parse the TTF
+    fonts = {}
+
+    def __init__(self, image, callback, prepared=None):
         """
         image: PIL Image to edit
         callback: function(edited_image or None) - None means cancelled
+        prepared: result of ScreenshotEditor.prepare(image, ...) if already made
         """
-        self.original_image = image.copy()
-        self.image = image.copy().convert('RGBA')
         self.callback = callback
         self.current_color = 'yellow'
         self.drawing = False
@@ -747,25 +1349,40 @@ class ScreenshotEditor:
         self.center_x = None  # For circle mode
         self.center_y = None
 
-        # Create highlight layer (transparent)
-        self.highlight_layer = Image.new('RGBA', self.image.size, (0, 0, 0, 0))
-        # Preview layer for shapes being drawn (circles)
-        self.preview_layer = Image.new('RGBA', self.image.size, (0, 0, 0, 0))
+        # Redraw throttling - strokes accumulate a dirty box, redrawn at most ~60 fps
+        self._dirty_bbox = None
+        self._redraw_after = None
+        self._circle_point = None  # Latest circle drag point, previewed on the next redraw
+        self._last_redraw = 0.0
+
+        # Display-coordinate area each overlay layer has drawn into (None = empty)
+        self.display_extent = None
+        self.preview_extent = None
+
+        # Annotations are kept as vector strokes and only rasterized at full
+        # resolution on save; the canvas shows them on a display-size layer
+        self.strokes = []
 
         # Create editor window
         self.window = tk.Toplevel()
         self.window.title("Edit Screenshot - Highlighter")
         self.window.attributes('-topmost', True)
 
-        # Calculate window size (fit to screen with some margin)
-        screen_w = self.window.winfo_screenwidth() - 100
-        screen_h = self.window.winfo_screenheight() - 150
-        img_w, img_h = self.image.size
+        # Read once - it's needed again to center the window below
+        screen_w, screen_h = self.window.winfo_screenwidth(), self.window.winfo_screenheight()
 
-        # Scale if image is too large
-        self.scale = min(1.0, screen_w / img_w, screen_h / img_h)
-        self.display_w = int(img_w * self.scale)
-        self.display_h = int(img_h * self.scale)
+        if prepared is None:
+            prepared = self.prepare(image, (screen_w, screen_h))
+        self.image, self.scale, self.display_base = prepared
+        self.display_w, self.display_h = self.display_base.size
+
+        # RGBA, not paletted - text outlines carry their own alpha
+        self.display_layer = Image.new('RGBA', (self.display_w, self.display_h), (0, 0, 0, 0))
+        # Preview layer for shapes being drawn (circles)
+        self.preview_layer = Image.new('RGBA', (self.display_w, self.display_h), (0, 0, 0, 0))
+        # Draw contexts are reused - building one costs about as much as a brush segment
+        self.display_draw = ImageDraw.Draw(self.display_layer)
+        self.preview_draw = ImageDraw.Draw(self.preview_layer)
 
         # Toolbar frame
         toolbar = tk.Frame(self.window, bg='#f0f0f0', pady=5)
@@ -842,6 +1459,13 @@ class ScreenshotEditor:
                                 cursor='crosshair', bg='gray')
         self.canvas.pack(padx=10, pady=10)
 
+        # Single canvas item and PhotoImage for the image, allocated once - frames
+        # are pasted into it in place and strokes only redraw the area they touch
+        self.photo = ImageTk.PhotoImage('RGB', (self.display_w, self.display_h))
+        # Scratch photo that dirty patches are staged in before copying across
+        self.patch_photo = ImageTk.PhotoImage('RGB', (self.display_w, self.display_h))
+        self.canvas_image = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+
         # Display the image
         self.update_display()
 
@@ -850,13 +1474,14 @@ class ScreenshotEditor:
         self.canvas.bind('<B1-Motion>', self.on_drag)
         self.canvas.bind('<ButtonRelease-1>', self.on_release)
         self.window.bind('<Escape>', lambda e: self.cancel())
+        self.window.bind('<Control-z>', lambda e: self.undo())
 
         # Center window
         self.window.update_idletasks()
         win_w = self.window.winfo_width()
         win_h = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() - win_w) // 2
-        y = (self.window.winfo_screenheight() - win_h) // 2
+        x = (screen_w - win_w) // 2
+        y = (screen_h - win_h) // 2
         self.window.geometry(f'+{x}+{y}')
 
         # Focus
@@ -865,6 +1490,38 @@ class ScreenshotEditor:
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self.cancel)
 
+    @staticmethod
+    def prepare(image, screen_size):
+        """Make the editor's RGB image, scale and display-size base image.
+
+        No Tk calls, so captures can run it on the capture thread instead of
+        stalling the UI while the editor opens.
+        """
+        # Kept as RGB - highlights are blended onto it on save
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        # Calculate window size (fit to screen with some margin)
+        screen_w = screen_size[0] - 100
+        screen_h = screen_size[1] - 150
+        img_w, img_h = image.size
+
+        # Scale if image is too large
+        scale = min(1.0, screen_w / img_w, screen_h / img_h)
+
+        # The canvas is composited at display size: the base image is scaled once
+        # here and strokes are stamped onto a display-size layer, so redraws
+        # never resample the full-resolution image
+        if scale < 1.0:
+            # reducing_gap box-reduces by the whole factor first and runs LANCZOS only
+            # over the rest - about half the time for a 4K capture, and this copy is
+            # only ever shown (save() blends onto the full-resolution image)
+            display_base = image.resize((int(img_w * scale), int(img_h * scale)),
+                                        Image.Resampling.LANCZOS, reducing_gap=1.0)
+        else:
+            display_base = image
+        return image, scale, display_base
+
     def select_color(self, color_name):
         """Select a highlight color"""
         # Reset all buttons
@@ -885,24 +1542,94 @@ class ScreenshotEditor:
         """Toggle horizontal lock mode"""
         self.horizontal_lock = self.lock_var.get()
 
+    def composite_region(self, box):
+        """Composite base + highlights + preview for a box of display coordinates (RGB)"""
+        region = self.display_base.crop(box)
+        self.paste_layer(region, box, self.display_layer, self.display_extent)
+        self.paste_layer(region, box, self.preview_layer, self.preview_extent)
+        return region
+
+    def paste_layer(self, region, box, layer, extent):
+        """Blend the part of an overlay layer that has content into a composited box"""
+        # A masked paste still visits every pixel, transparent or not, so only
+        # the overlap with the layer's drawn extent is pasted
+        if extent is None:
+            return
+        x1, y1 = max(box[0], extent[0]), max(box[1], extent[1])
+        x2, y2 = min(box[2], extent[2]), min(box[3], extent[3])
+        if x2 <= x1 or y2 <= y1:
+            return
+        # Pasting a layer through its own alpha is an "over" blend straight into
+        # the RGB copy - no RGBA intermediates or final convert('RGB') pass
+        patch = layer.crop((x1, y1, x2, y2))
+        region.paste(patch, (x1 - box[0], y1 - box[1]), patch)
+
     def update_display(self):
         """Update the canvas with current image + highlights"""
-        # Composite highlight layer onto image
-        display_img = Image.alpha_composite(self.image, self.highlight_layer)
-        # Add preview layer (for shapes being drawn)
-        display_img = Image.alpha_composite(display_img, self.preview_layer)
+        display_img = self.composite_region((0, 0, self.display_w, self.display_h))
+
+        # Upload into the existing PhotoImage
+        self.photo.paste(display_img)
 
-        # Convert to RGB for display
-        display_img = display_img.convert('RGB')
+    def update_region(self, bbox):
+        """Redraw only the part of the canvas covering bbox (image coordinates)"""
+        x1, y1, x2, y2 = bbox
 
-        # Scale for display
-        if self.scale < 1.0:
-            display_img = display_img.resize((self.display_w, self.display_h), Image.Resampling.LANCZOS)
+        # Canvas pixels touched by the change
+        dx1 = max(0, int(x1 * self.scale) - 1)
+        dy1 = max(0, int(y1 * self.scale) - 1)
+        dx2 = min(self.display_w, int(x2 * self.scale) + 2)
+        dy2 = min(self.display_h, int(y2 * self.scale) + 2)
+        if dx2 <= dx1 or dy2 <= dy1:
+            return
 
-        # Convert to PhotoImage
-        self.photo = ImageTk.PhotoImage(display_img)
-        self.canvas.delete('all')
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+        patch = self.composite_region((dx1, dy1, dx2, dy2))
+        if (dx1, dy1, dx2, dy2) == (0, 0, self.display_w, self.display_h):
+            # Whole canvas (undoing a large stroke) - upload directly, no staging copy
+            self.photo.paste(patch)
+            return
+
+        # Stage the patch at the scratch photo's origin, then copy it into place
+        self.patch_photo.paste(patch)
+        self.photo.tk.call(str(self.photo), 'copy', str(self.patch_photo),
+                           '-from', 0, 0, dx2 - dx1, dy2 - dy1, '-to', dx1, dy1)
+
+    def mark_dirty(self, bbox):
+        """Queue a region for redraw - mouse events can arrive far faster than 60 fps"""
+        self._dirty_bbox = union_bbox(self._dirty_bbox, bbox)
+        self.schedule_redraw()
+
+    def schedule_redraw(self):
+        """Queue flush_redraw: as soon as the pending events are handled, but at most ~60 fps"""
+        if self._redraw_after is None:
+            wait = int(16 - (time.monotonic() - self._last_redraw) * 1000)
+            if wait > 0:
+                self._redraw_after = self.window.after(wait, self.flush_redraw)
+            else:
+                # Idle callbacks run once the event queue is empty, so a burst of
+                # motion events still coalesces into one redraw
+                self._redraw_after = self.window.after_idle(self.flush_redraw)
+
+    def mark_dirty_display(self, box):
+        """Queue a region for redraw, given in display coordinates (None = nothing)"""
+        if box is not None:
+            self.mark_dirty(tuple(c / self.scale for c in box))
+
+    def flush_redraw(self):
+        """Redraw the queued dirty region now"""
+        if self._circle_point is not None:
+            # Only the latest drag point is drawn - motion events in between are skipped
+            x, y = self._circle_point
+            self._circle_point = None
+            self.render_circle_preview(x, y)
+        if self._redraw_after is not None:
+            self.window.after_cancel(self._redraw_after)
+            self._redraw_after = None
+        if self._dirty_bbox is not None:
+            bbox = self._dirty_bbox
+            self._dirty_bbox = None
+            self.update_region(bbox)
+            self._last_redraw = time.monotonic()
 
     def canvas_to_image_coords(self, x, y):
         """Convert canvas coordinates to image coordinates"""
@@ -941,6 +1668,10 @@ class ScreenshotEditor:
                 # Use locked Y if horizontal lock is enabled
                 if self.horizontal_lock and self.lock_y is not None:
                     y = self.lock_y
+                # Nothing to stamp if the point didn't move (vertical motion under the
+                # straight-line lock, or repeated motion events for the same pixel)
+                if (x, y) == (self.last_x, self.last_y):
+                    return
                 self.draw_line(self.last_x, self.last_y, x, y)
                 self.last_x, self.last_y = x, y
 
@@ -949,6 +1680,8 @@ class ScreenshotEditor:
             # Commit the circle to the highlight layer
             x, y = self.canvas_to_image_coords(event.x, event.y)
             self.commit_circle(x, y)
+        elif self.drawing:
+            self.flush_redraw()
 
         self.drawing = False
         self.last_x = None
@@ -957,77 +1690,159 @@ class ScreenshotEditor:
         self.center_x = None
         self.center_y = None
 
+    def render_stroke(self, draw, stroke, s, origin=(0, 0)):
+        """Rasterize one recorded stroke, with image coordinates and sizes scaled by s
+        and the scaled origin point drawn at the layer's top-left.
+        Returns the (padded) box it drew into, in layer coordinates."""
+        kind = stroke[0]
+        dx, dy = origin
+        if kind == 'line':
+            _, xs, ys, color, width = stroke
+            x1, y1 = xs[0], ys[0]
+            for x2, y2 in zip(xs, ys):
+                self.render_segment(draw, x1, y1, x2, y2, color, width, s, origin)
+                x1, y1 = x2, y2
+            r = width // 2
+            return (int((min(xs) - r) * s) - 1 - dx, int((min(ys) - r) * s) - 1 - dy,
+                    int((max(xs) + r) * s) + 2 - dx, int((max(ys) + r) * s) + 2 - dy)
+        elif kind == 'circle':
+            _, bbox, color, width = stroke
+            box = [bbox[0] * s - dx, bbox[1] * s - dy, bbox[2] * s - dx, bbox[3] * s - dy]
+            draw.ellipse(box, outline=color, width=max(1, round(width * s)))
+            return (int(box[0]) - 1, int(box[1]) - 1, int(box[2]) + 2, int(box[3]) + 2)
+        elif kind == 'text':
+            _, x, y, text, color, size = stroke
+            font = self.load_font(max(1, round(size * s)))
+            # Draw text with a slight outline for better visibility
+            # Rasterize the glyphs once into a mask; a 3x3 max filter grows it
+            # by 1px in each direction for the outline
+            x, y = x * s - dx, y * s - dy
+            left, top, right, bottom = draw.textbbox((x, y), text, font=font)
+            ox, oy = int(left) - 1, int(top) - 1
+            mask = Image.new('L', (int(right) + 2 - ox, int(bottom) + 2 - oy), 0)
+            ImageDraw.Draw(mask).text((x - ox, y - oy), text, font=font, fill=255)
+            outline_color = (0, 0, 0, 150)  # Semi-transparent black
+            draw.bitmap((ox, oy), mask.filter(ImageFilter.MaxFilter(3)), fill=outline_color)
+
+            # Draw main text
+            draw.bitmap((ox, oy), mask, fill=color)
+            return (ox, oy, ox + mask.width, oy + mask.height)
+
+    def render_segment(self, draw, x1, y1, x2, y2, color, width, s, origin=(0, 0)):
+        """Rasterize one highlight segment - a thick line capped with a circle"""
+        r = width // 2
+        dx, dy = origin
+        if (x1, y1) != (x2, y2):
+            draw.line([x1 * s - dx, y1 * s - dy, x2 * s - dx, y2 * s - dy], fill=color,
+                      width=max(1, round(width * s)))
+        # Draw circles at endpoints for smooth lines
+        draw.ellipse([(x2 - r) * s - dx, (y2 - r) * s - dy,
+                      (x2 + r) * s - dx, (y2 + r) * s - dy], fill=color)
+
+    def add_stroke(self, stroke):
+        """Record a finished stroke and stamp it onto the display layer.
+        Returns the display box it covers."""
+        self.strokes.append(stroke)
+        box = self.render_stroke(self.display_draw, stroke, self.scale)
+        # Grown from the stroke's own box - getbbox() would scan the whole layer
+        self.display_extent = union_bbox(self.display_extent, box)
+        return box
+
+    def undo(self):
+        """Remove the last stroke and rebuild the display layer from the rest"""
+        if self.drawing or not self.strokes:
+            return
+        stroke = self.strokes.pop()
+        # Measure the undone stroke by rendering it somewhere throwaway - only that
+        # area of the canvas changes, so only it is recomposited and uploaded
+        dirty = self.render_stroke(ImageDraw.Draw(Image.new('RGBA', (1, 1))), stroke, self.scale)
+        # The layer itself is rebuilt whole: text is blended onto it, so restamping
+        # strokes over a partly cleared layer would darken their edges
+        self.display_layer.paste((0, 0, 0, 0), (0, 0) + self.display_layer.size)
+        self.display_extent = None
+        for stroke in self.strokes:
+            self.display_extent = union_bbox(self.display_extent,
+                                             self.render_stroke(self.display_draw, stroke, self.scale))
+        self.mark_dirty_display(dirty)
+        self.flush_redraw()
+
     def draw_highlight(self, x, y):
-        """Draw a highlight circle at position"""
-        from PIL import ImageDraw
-        draw = ImageDraw.Draw(self.highlight_layer)
-        color = self.COLORS[self.current_color]
+        """Start a highlight stroke at position"""
+        # Points are kept as parallel int arrays rather than a list of (x, y) tuples -
+        # a long drag is thousands of points, and undo/save replay every one
+        self.add_stroke(('line', array('i', [x]), array('i', [y]),
+                         self.COLORS[self.current_color], self.brush_size))
         r = self.brush_size // 2
-        draw.ellipse([x - r, y - r, x + r, y + r], fill=color)
-        self.update_display()
+        self.mark_dirty((x - r, y - r, x + r + 1, y + r + 1))
 
     def draw_line(self, x1, y1, x2, y2):
-        """Draw a highlight line between two points"""
-        from PIL import ImageDraw
-        draw = ImageDraw.Draw(self.highlight_layer)
-        color = self.COLORS[self.current_color]
-        draw.line([x1, y1, x2, y2], fill=color, width=self.brush_size)
-        # Draw circles at endpoints for smooth lines
-        r = self.brush_size // 2
-        draw.ellipse([x2 - r, y2 - r, x2 + r, y2 + r], fill=color)
-        self.update_display()
+        """Extend the current highlight stroke to a new point"""
+        _, xs, ys, color, width = self.strokes[-1]
+        xs.append(x2)
+        ys.append(y2)
+        # Only the new segment is stamped - earlier ones are already on the layer
+        self.render_segment(self.display_draw, x1, y1, x2, y2, color, width, self.scale)
+        r = width // 2
+        s = self.scale
+        self.display_extent = union_bbox(self.display_extent, (
+            int((min(x1, x2) - r) * s) - 1, int((min(y1, y2) - r) * s) - 1,
+            int((max(x1, x2) + r) * s) + 2, int((max(y1, y2) + r) * s) + 2))
+        self.mark_dirty((min(x1, x2) - r, min(y1, y2) - r,
+                         max(x1, x2) + r + 1, max(y1, y2) + r + 1))
 
     def draw_circle_preview(self, x, y):
-        """Draw a preview of the circle/oval being created"""
-        from PIL import ImageDraw
-        # Clear preview layer
-        self.preview_layer = Image.new('RGBA', self.image.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(self.preview_layer)
-        color = self.COLORS[self.current_color]
+        """Queue a preview of the circle/oval being created for the next redraw"""
+        self._circle_point = (x, y)
+        self.schedule_redraw()
+
+    def render_circle_preview(self, x, y):
+        """Draw the circle/oval preview onto the preview layer"""
+        # Clear the previous preview - only the area it covered needs wiping and redrawing
+        old_extent = self.preview_extent
+        if old_extent is not None:
+            self.preview_layer.paste((0, 0, 0, 0), old_extent)
+        self.preview_extent = None
 
         # Calculate radii based on distance from center
         rx = abs(x - self.center_x)
         ry = abs(y - self.center_y)
 
         if rx > 2 or ry > 2:  # Only draw if dragged a bit
-            # Draw ellipse outline (thicker line for visibility)
-            bbox = [self.center_x - rx, self.center_y - ry,
-                    self.center_x + rx, self.center_y + ry]
-            # Draw with stroke width based on brush size
-            for offset in range(self.brush_size // 2):
-                draw.ellipse([bbox[0] - offset, bbox[1] - offset,
-                             bbox[2] + offset, bbox[3] + offset],
-                            outline=color)
+            # Rendered exactly as the committed stroke will be - one thick ellipse
+            # outline at display size
+            self.preview_extent = self.render_stroke(self.preview_draw, (
+                'circle', self.circle_bbox(rx, ry), self.COLORS[self.current_color],
+                self.brush_size // 2), self.scale)
 
-        self.update_display()
+        self.mark_dirty_display(union_bbox(old_extent, self.preview_extent))
 
-    def commit_circle(self, x, y):
-        """Commit the circle to the highlight layer"""
-        from PIL import ImageDraw
-        # Clear preview
-        self.preview_layer = Image.new('RGBA', self.image.size, (0, 0, 0, 0))
+    def circle_bbox(self, rx, ry):
+        """Bounding box for the circle outline - the stroke grows outward from the radius"""
+        grow = self.brush_size // 2 - 1
+        return [self.center_x - rx - grow, self.center_y - ry - grow,
+                self.center_x + rx + grow, self.center_y + ry + grow]
 
-        # Draw final circle on highlight layer
-        draw = ImageDraw.Draw(self.highlight_layer)
-        color = self.COLORS[self.current_color]
+    def commit_circle(self, x, y):
+        """Commit the circle as a stroke"""
+        # Clear preview (and drop any preview still queued)
+        self._circle_point = None
+        dirty = self.preview_extent
+        if dirty is not None:
+            self.preview_layer.paste((0, 0, 0, 0), dirty)
+        self.preview_extent = None
 
         rx = abs(x - self.center_x)
         ry = abs(y - self.center_y)
 
         if rx > 2 or ry > 2:
-            bbox = [self.center_x - rx, self.center_y - ry,
-                    self.center_x + rx, self.center_y + ry]
-            # Draw with stroke width
-            for offset in range(self.brush_size // 2):
-                draw.ellipse([bbox[0] - offset, bbox[1] - offset,
-                             bbox[2] + offset, bbox[3] + offset],
-                            outline=color)
+            dirty = union_bbox(dirty, self.add_stroke((
+                'circle', self.circle_bbox(rx, ry), self.COLORS[self.current_color], self.brush_size // 2)))
 
-        self.update_display()
+        self.mark_dirty_display(dirty)
+        self.flush_redraw()
 
     def show_text_dialog(self, x, y):
         """Show a dialog to enter text, then draw it at position"""
-        from tkinter import simpledialog
 
         # Ask for text input
         text = simpledialog.askstring(
@@ -1039,48 +1854,62 @@ class ScreenshotEditor:
         if text:
             self.draw_text(x, y, text)
 
+    def load_font(self, size):
+        """Load the annotation font at the given size (cached - parsing the TTF is slow)"""
+        font = self.fonts.get(size)
+        if font is None:
+            # Try to load a nice font, fall back to default
+            try:
+                # Try common Windows fonts
+                font = ImageFont.truetype("arial.ttf", size)
+            except OSError:
+                try:
+                    font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", size)
+                except OSError:
+                    # Fall back to default font
+                    font = ImageFont.load_default()
+            self.fonts[size] = font
+        return font
+
     def draw_text(self, x, y, text):
         """Draw text at the specified position"""
-        from PIL import ImageDraw, ImageFont
-
-        draw = ImageDraw.Draw(self.highlight_layer)
-        color = self.COLORS[self.current_color]
-
         # Use brush_size to determine font size (scaled up for readability)
         font_size = self.brush_size * 2
-
-        # Try to load a nice font, fall back to default
-        try:
-            # Try common Windows fonts
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except:
-            try:
-                font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", font_size)
-            except:
-                # Fall back to default font
-                font = ImageFont.load_default()
-
-        # Draw text with a slight outline for better visibility
-        # Draw outline by drawing text offset in each direction
-        outline_color = (0, 0, 0, 150)  # Semi-transparent black
-        for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (1, 0), (0, -1), (0, 1)]:
-            draw.text((x + dx, y + dy), text, font=font, fill=outline_color)
-
-        # Draw main text
-        draw.text((x, y), text, font=font, fill=color)
-
-        self.update_display()
+        self.mark_dirty_display(self.add_stroke(
+            ('text', x, y, text, self.COLORS[self.current_color], font_size)))
+        self.flush_redraw()
 
     def save(self):
         """Save the edited image"""
-        # Composite and convert to RGB
-        final_image = Image.alpha_composite(self.image, self.highlight_layer)
-        final_image = final_image.convert('RGB')
+        self.flush_redraw()
+        # Blended in place - the editor owns its image and closes right after, so a
+        # full-size copy would only be thrown away (and unannotated saves need none)
+        final_image = self.image
+        if self.strokes:
+            # Measure the annotated area first (drawing into a throwaway 1x1 image),
+            # so the full-resolution layer only needs to cover that - on a large
+            # capture a full-size RGBA layer is hundreds of MB to allocate and clear
+            probe = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+            extent = None
+            for stroke in self.strokes:
+                extent = union_bbox(extent, self.render_stroke(probe, stroke, 1.0))
+            x1, y1 = max(0, extent[0]), max(0, extent[1])
+            x2, y2 = min(self.image.width, extent[2]), min(self.image.height, extent[3])
+            if x2 > x1 and y2 > y1:
+                # Rasterize every stroke once at full resolution, shifted into the layer
+                highlight_layer = Image.new('RGBA', (x2 - x1, y2 - y1), (0, 0, 0, 0))
+                draw = ImageDraw.Draw(highlight_layer)
+                for stroke in self.strokes:
+                    self.render_stroke(draw, stroke, 1.0, (x1, y1))
+                # Blend highlights onto the RGB image through the layer's own alpha
+                final_image.paste(highlight_layer, (x1, y1), highlight_layer)
         self.window.destroy()
         self.callback(final_image)
 
     def cancel(self):
         """Cancel editing"""
+        if self._redraw_after is not None:
+            self.window.after_cancel(self._redraw_after)
         self.window.destroy()
         self.callback(None)
 
@@ -1095,6 +1924,11 @@ class ScreenshotTool:
         # Set up save directory
         self.save_dir = Path.home() / "Pictures" / "Screenshots"
         self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.disk_usage_cache = None  # (save_dir mtime_ns, screenshot bytes)
+
+        # Gallery thumbnail cache (dot folder, so it's not listed as a folder)
+        self.thumb_dir = self.save_dir / ".thumbs"
+        self.thumb_dir.mkdir(exist_ok=True)
 
         # Push targets configuration
         self.config_file = self.save_dir / "screenshot_tool_config.json"
@@ -1108,9 +1942,21 @@ class ScreenshotTool:
         self.hotkey_full = "ctrl+shift+s"
         self.hotkey_region = "ctrl+shift+r"
         self.hotkey_window = "ctrl+shift+w"
-        self.hotkeys_registered = False
+        self.hotkey_listener = None
+        self.target_hotkey = None  # Temporary Ctrl+Shift+T listener while adding a target
         self._capture_in_progress = False  # Prevent multiple simultaneous captures
 
+        # Screen grabs run here so the Tk thread keeps painting during a capture
+        self.capture_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # PNG encoding and the clipboard upload run here; one worker keeps saves in order
+        self.io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # Gallery thumbnails are decoded in parallel
+        self.thumb_executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+
+        # Gallery <Configure> events arrive in bursts; layout is applied once per idle pass
+        self._scroll_pending = False
+        self._canvas_width = None
+
         # Screenshot counter for this session
         self.screenshot_count = 0
 
@@ -1127,10 +1973,24 @@ class ScreenshotTool:
         # Silent capture - don't switch desktop after capture
         self.silent_capture = tk.BooleanVar(value=False)
 
+        # Last window found for each push target (name -> hwnd)
+        self.target_hwnds = {}
+
         # Drag and drop state
         self.drag_data = {"filepath": None, "widget": None}
         self.drag_label = None  # Floating label during drag
         self.folder_drop_targets = {}  # folder_name -> button widget
+        self.folder_button_names = {}  # folder button widget path -> folder name
+        self.thumb_paths = {}  # thumbnail label path -> (screenshot path, photo)
+        self.thumb_cells = []  # Thumbnail labels in gallery order, reused across refreshes
+        self.thumb_rows = []  # Row frames holding thumb_cells
+        self.thumb_layout = None  # Thumbnails per row the cells are laid out for
+        self.thumb_photos = {}  # screenshot path -> ((mtime, size, sharp), photo) on screen
+        self.gallery_generation = 0  # Bumped per refresh so late thumbnails from an old one are dropped
+        self.gallery_state = None  # (listing, thumb size, sharp) the grid currently shows
+        self.thumb_placeholder = None  # (size, blank photo) shown while a thumbnail decodes
+        self.thumb_press = (0, 0)  # Root coords of the last press on a thumbnail
+        self.thumb_dragging = False
 
         # Track all floating windows for cleanup
         self.floating_windows = []
@@ -1150,6 +2010,9 @@ class ScreenshotTool:
         # Load existing screenshots
         self.refresh_gallery()
 
+        # Drop thumbnails left behind by screenshots removed since last run
+        self.io_executor.submit(self.prune_thumbnails, self.save_dir, self.thumb_dir)
+
         # Periodic cleanup of floating windows (every 5 seconds)
         self.schedule_cleanup()
 
@@ -1165,6 +2028,7 @@ class ScreenshotTool:
         self.capture_mode_var = tk.StringVar(value="Region")
         self.delay_var = tk.StringVar(value="0")
         self.thumbnail_scale = tk.IntVar(value=5)  # 1-10, 5 = current size (120x90)
+        self.sharp_thumbnails = tk.BooleanVar(value=False)  # LANCZOS instead of BILINEAR
         self.disk_limit_mb = tk.IntVar(value=500)  # Max disk space in MB
         self.archive_days = tk.IntVar(value=30)  # Days before suggesting cleanup
 
@@ -1235,6 +2099,9 @@ class ScreenshotTool:
         status_label = ttk.Label(right_frame, textvariable=self.status_var, foreground="gray")
         status_label.pack(fill=tk.X, pady=(0, 5))
 
+        # Capture flash (placed over the window edge by flash_notification)
+        self.flash_strip = tk.Frame(self.root, bg="green", height=6)
+
         # Current folder filter (None = show all)
         self.current_folder = None
 
@@ -1246,6 +2113,11 @@ class ScreenshotTool:
         self.folder_buttons_frame = ttk.Frame(folder_bar)
         self.folder_buttons_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
+        # Folder button clicks/menus come from one tag, like gallery thumbnails,
+        # instead of new closures bound on every widget of every button per rebuild
+        self.folder_buttons_frame.bind_class("FolderButton", "<Button-1>", self.on_folder_click)
+        self.folder_buttons_frame.bind_class("FolderButton", "<Button-3>", self.on_folder_menu)
+
         # New folder button
         ttk.Button(folder_bar, text="+", width=3, command=self.create_new_folder).pack(side=tk.RIGHT, padx=(5, 0))
 
@@ -1272,40 +2144,83 @@ class ScreenshotTool:
         self.gallery_frame.bind("<Configure>", self.on_frame_configure)
         self.canvas.bind("<Configure>", self.on_canvas_configure)
 
-        # Mouse wheel scrolling
-        self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
+        # Mouse wheel scrolling - only over the gallery, via a bind tag; bind_all
+        # ran for every wheel event in the app and scrolled the gallery from the editor
+        self.canvas.bind_class("GalleryWheel", "<MouseWheel>", self.on_mousewheel)
+        self.add_wheel_scrolling(self.canvas)
+
+        # Thumbnail click/drag/menu handlers - bound once on a tag rather than
+        # registering four new callbacks per thumbnail on every refresh
+        self.canvas.bind_class("GalleryThumb", "<Button-1>", self.on_thumb_press)
+        self.canvas.bind_class("GalleryThumb", "<B1-Motion>", self.on_thumb_motion)
+        self.canvas.bind_class("GalleryThumb", "<ButtonRelease-1>", self.on_thumb_release)
+        self.canvas.bind_class("GalleryThumb", "<Button-3>", self.show_thumb_menu)
 
     def on_frame_configure(self, event=None):
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.root.after_idle(self.apply_scrollregion)
+
+    def apply_scrollregion(self):
+        self._scroll_pending = False
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def on_canvas_configure(self, event):
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
+        if self._canvas_width is None:
+            self.root.after_idle(self.apply_canvas_width)
+        self._canvas_width = event.width
+
+    def apply_canvas_width(self):
+        self.canvas.itemconfig(self.canvas_window, width=self._canvas_width)
+        self._canvas_width = None
 
     def on_mousewheel(self, event):
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
+    def add_wheel_scrolling(self, widget):
+        """Make the wheel scroll the gallery over widget and all its children"""
+        tags = widget.bindtags()
+        if "GalleryWheel" not in tags:
+            widget.bindtags(tags[:1] + ("GalleryWheel",) + tags[1:])
+        for child in widget.winfo_children():
+            self.add_wheel_scrolling(child)
+
     def register_hotkeys(self):
         try:
-            keyboard.add_hotkey(self.hotkey_full, self.capture_fullscreen_threadsafe)
-            keyboard.add_hotkey(self.hotkey_region, self.start_region_capture_threadsafe)
-            keyboard.add_hotkey(self.hotkey_window, self.start_window_capture_threadsafe)
-            self.hotkeys_registered = True
+            self.hotkey_listener = HotkeyListener({
+                self.hotkey_full: self.capture_fullscreen_threadsafe,
+                self.hotkey_region: self.start_region_capture_threadsafe,
+                self.hotkey_window: self.start_window_capture_threadsafe,
+            })
+            failed = self.hotkey_listener.start()
             print(f"Global hotkeys registered:")
             print(f"  {self.hotkey_region} - Region capture")
             print(f"  {self.hotkey_full} - Full screen capture")
             print(f"  {self.hotkey_window} - Window capture")
+            if failed:
+                print(f"Hotkeys already in use by another app: {', '.join(failed)}")
+                self.status_var.set(f"Warning: Hotkeys in use elsewhere - {', '.join(failed)}")
         except Exception as e:
             print(f"Failed to register hotkeys: {e}")
             self.status_var.set(f"Warning: Could not register global hotkeys - {e}")
 
     def unregister_hotkeys(self):
-        if self.hotkeys_registered:
+        if self.hotkey_listener:
+            try:
+                self.hotkey_listener.stop()
+            except:
+                pass
+            self.hotkey_listener = None
+        self.stop_target_hotkey()
+
+    def stop_target_hotkey(self):
+        """Release the temporary target-capture hotkey, if one is waiting"""
+        if self.target_hotkey:
             try:
-                keyboard.remove_hotkey(self.hotkey_full)
-                keyboard.remove_hotkey(self.hotkey_region)
-                keyboard.remove_hotkey(self.hotkey_window)
+                self.target_hotkey.stop()
             except:
                 pass
+            self.target_hotkey = None
 
     def start_window_capture_threadsafe(self):
         # Prevent multiple hotkey triggers
@@ -1337,19 +2252,54 @@ class ScreenshotTool:
         elif mode == "Full Screen":
             self.capture_fullscreen()
 
+    def grab_async(self, monitor, on_done, settle=0, hwnd=None):
+        """Grab the screen (or window hwnd) on the capture thread, then call on_done(future)
+        on the Tk thread. The future's result is (image, prepared editor image or None)."""
+        # Shots headed for the editor get its scaled copy made on the capture thread too
+        # (Tk state is read here, on the Tk thread)
+        screen_size = None
+        if self.edit_before_save.get():
+            screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+
+        def grab():
+            if hwnd is not None:
+                img = grab_window(hwnd, monitor, settle)
+            else:
+                if settle:
+                    time.sleep(settle)
+                img = grab_screen(monitor)
+            prepared = ScreenshotEditor.prepare(img, screen_size) if screen_size else None
+            return img, prepared
+
+        self.poll_future(self.capture_executor.submit(grab), on_done)
+
+    def poll_future(self, future, on_done):
+        # Tk isn't thread-safe, so the Tk thread checks back instead of being called into
+        if future.done():
+            on_done(future)
+        else:
+            self.root.after(10, lambda: self.poll_future(future, on_done))
+
+    def restore_after_capture(self):
+        """Show the main window again after a capture hid it (minimized in silent mode)"""
+        if self.silent_capture.get():
+            # A withdrawn window has no taskbar button, so leave it minimized instead
+            self.root.iconify()
+        else:
+            self.root.deiconify()
+
     def start_window_capture(self):
         """Start the window selection process"""
         delay = int(self.delay_var.get())
 
         if delay > 0:
             self.status_var.set(f"Countdown: {delay} seconds - set up your screen!")
-            self.root.iconify()
-            self.root.after(200, lambda: DelayCountdown(delay, self._on_window_delay_complete))
+            self.root.withdraw()
+            DelayCountdown(delay, self._on_window_delay_complete)
         else:
             self.status_var.set("Click on a window to capture...")
-            self.root.update()
-            self.root.iconify()
-            self.root.after(200, self._show_window_selector)
+            self.root.withdraw()
+            self._show_window_selector()
 
     def _on_window_delay_complete(self, proceed):
         """Called when window delay countdown finishes"""
@@ -1369,13 +2319,14 @@ class ScreenshotTool:
 
         if hwnd is None:
             self.status_var.set("Window capture cancelled")
-            if not self.silent_capture.get():
-                self.root.deiconify()
+            self.restore_after_capture()
             return
 
         # Only restore window if not in silent capture mode (and not using editor)
-        if not self.silent_capture.get() or self.edit_before_save.get():
+        if self.edit_before_save.get():
             self.root.deiconify()
+        else:
+            self.restore_after_capture()
 
         self.capture_window(hwnd)
 
@@ -1387,11 +2338,21 @@ class ScreenshotTool:
         from ctypes import windll
 
         try:
+            # The grab is asynchronous, so the main loop paints this status itself -
+            # no update() (which would also run any queued events in here)
             self.status_var.set("Capturing window...")
-            self.root.update()
 
-            # Get window rectangle
+            # Get window rectangle - the visible frame, without the invisible resize
+            # borders GetWindowRect includes on Windows 10+
             left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+            try:
+                rect = wintypes.RECT()
+                DWMWA_EXTENDED_FRAME_BOUNDS = 9
+                if windll.dwmapi.DwmGetWindowAttribute(
+                        hwnd, DWMWA_EXTENDED_FRAME_BOUNDS, ctypes.byref(rect), ctypes.sizeof(rect)) == 0:
+                    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+            except Exception:
+                pass
             width = right - left
             height = bottom - top
 
@@ -1400,22 +2361,32 @@ class ScreenshotTool:
                 return
 
             # Bring window to front briefly to ensure it's visible
+            settle = 0
             try:
                 win32gui.SetForegroundWindow(hwnd)
-                time.sleep(0.1)
+                settle = 0.1
             except:
                 pass
 
-            # Capture using mss (more reliable)
-            with mss.mss() as sct:
-                monitor = {"top": top, "left": left, "width": width, "height": height}
-                screenshot = sct.grab(monitor)
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+            # Capture the window (any settle wait happens off the Tk thread too)
+            self.grab_async({"top": top, "left": left, "width": width, "height": height},
+                            self._on_window_grabbed, settle, hwnd)
+
+        except Exception as e:
+            error_msg = f"Error capturing window: {e}"
+            self.status_var.set(error_msg)
+            print(error_msg)
+            messagebox.showerror("Error", error_msg)
+
+    def _on_window_grabbed(self, future):
+        """Called on the Tk thread once the window grab finishes"""
+        try:
+            img, prepared = future.result()
 
             # Open editor or save directly
             if self.edit_before_save.get():
                 self.status_var.set("Edit screenshot (add highlights, then Save or Cancel)")
-                ScreenshotEditor(img, self.on_editor_complete)
+                ScreenshotEditor(img, self.on_editor_complete, prepared)
             else:
                 self.save_screenshot(img)
 
@@ -1438,13 +2409,12 @@ class ScreenshotTool:
 
         if delay > 0:
             self.status_var.set(f"Countdown: {delay} seconds - set up your screen!")
-            self.root.iconify()
-            self.root.after(200, lambda: DelayCountdown(delay, self._on_scrolling_delay_complete))
+            self.root.withdraw()
+            DelayCountdown(delay, self._on_scrolling_delay_complete)
         else:
             self.status_var.set("Click on a window for scrolling capture...")
-            self.root.update()
-            self.root.iconify()
-            self.root.after(200, self._show_scrolling_window_selector)
+            self.root.withdraw()
+            self._show_scrolling_window_selector()
 
     def _on_scrolling_delay_complete(self, proceed):
         """Called when scrolling delay countdown finishes"""
@@ -1464,25 +2434,23 @@ class ScreenshotTool:
 
         if hwnd is None:
             self.status_var.set("Scrolling capture cancelled")
-            if not self.silent_capture.get():
-                self.root.deiconify()
+            self.restore_after_capture()
             return
 
         # Start scrolling capture with auto-detection
         ScrollingCapture(hwnd, self.on_scrolling_capture_complete,
-                        scroll_delay=0.2, max_iterations=50)
+                        scroll_delay=0.2, max_iterations=50,
+                        capture_executor=self.capture_executor)
 
     def on_scrolling_capture_complete(self, image):
         """Called when scrolling capture is complete"""
         if image is None:
             self.status_var.set("Scrolling capture cancelled")
-            if not self.silent_capture.get():
-                self.root.deiconify()
+            self.restore_after_capture()
             return
 
         # Restore window if not in silent mode
-        if not self.silent_capture.get():
-            self.root.deiconify()
+        self.restore_after_capture()
 
         # Open editor or save directly
         if self.edit_before_save.get():
@@ -1498,14 +2466,15 @@ class ScreenshotTool:
         if delay > 0:
             # Start countdown, then capture region
             self.status_var.set(f"Countdown: {delay} seconds - set up your screen!")
-            self.root.iconify()
-            self.root.after(200, lambda: DelayCountdown(delay, self._on_region_delay_complete))
+            self.root.withdraw()
+            DelayCountdown(delay, self._on_region_delay_complete)
         else:
             # No delay - capture immediately
             self.status_var.set("Select a region...")
-            self.root.update()
-            self.root.iconify()
-            self.root.after(200, self._show_region_selector)
+            # withdraw() hides at once (iconify plays the minimize animation);
+            # the short wait only lets the compositor drop the window before the grab
+            self.root.withdraw()
+            self.root.after(50, self._show_region_selector)
 
     def _on_region_delay_complete(self, proceed):
         """Called when region delay countdown finishes"""
@@ -1516,52 +2485,87 @@ class ScreenshotTool:
             self.status_var.set("Capture cancelled")
 
     def _show_region_selector(self):
-        """Show the region selector overlay"""
-        RegionSelector(self.on_region_selected)
+        """Grab the screen on the capture thread, then show the region selector over it"""
+        # The grab and the dimmed backdrop are the slow part of opening the overlay;
+        # done on the capture thread they use its warm DXGI/GDI handles and the UI
+        # keeps painting meanwhile
+        def grab():
+            img = grab_screen(1)  # Primary monitor
+            return img, img.point(DIM_LUT)
+
+        self.poll_future(self.capture_executor.submit(grab), self._on_selector_grabbed)
+
+    def _on_selector_grabbed(self, future):
+        """Open the region selector once its screen grab is ready"""
+        try:
+            img, dimmed = future.result()
+        except Exception as e:
+            self._capture_in_progress = False
+            self.status_var.set(f"Error capturing screen: {e}")
+            print(f"Error capturing screen: {e}")
+            self.restore_after_capture()
+            return
+        RegionSelector(self.on_region_selected, img, dimmed)
 
     def on_region_selected(self, region, cropped_image):
         """Called when region selection is complete"""
         self._capture_in_progress = False  # Reset flag
 
         # Only restore main window if not in silent capture mode
-        if not self.silent_capture.get():
-            self.root.deiconify()
+        self.restore_after_capture()
 
         if region is None or cropped_image is None:
             self.status_var.set("Region capture cancelled")
-            if not self.silent_capture.get():
-                self.root.deiconify()  # Show window on cancel
+            self.restore_after_capture()  # Show window on cancel
             return
 
         # Image is already captured and cropped by RegionSelector
         # Open editor or save directly
         if self.edit_before_save.get():
-            self.status_var.set("Edit screenshot (add highlights, then Save or Cancel)")
-            # Editor needs window visible
-            self.root.deiconify()
-            ScreenshotEditor(cropped_image, self.on_editor_complete)
+            # The editor's scaled copy is made on the capture thread, as for the
+            # other capture modes - a large region's LANCZOS resize stalls the UI
+            screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+            future = self.capture_executor.submit(ScreenshotEditor.prepare, cropped_image, screen_size)
+            self.poll_future(future, lambda f: self._open_region_editor(cropped_image, f))
         else:
             self.save_screenshot(cropped_image)
 
+    def _open_region_editor(self, cropped_image, future):
+        """Open the editor on a selected region once its display copy is ready"""
+        try:
+            prepared = future.result()
+        except Exception as e:
+            print(f"Error preparing editor image: {e}")
+            prepared = None  # The editor makes it itself
+        self.status_var.set("Edit screenshot (add highlights, then Save or Cancel)")
+        # Editor needs window visible
+        self.root.deiconify()
+        ScreenshotEditor(cropped_image, self.on_editor_complete, prepared)
+
     def capture_region(self, x1, y1, x2, y2):
         """Capture a specific region of the screen"""
         try:
-            self.status_var.set("Capturing region...")
-            self.root.update()
+            self.status_var.set("Capturing region...")  # Painted once we're back in the main loop
 
-            # Small delay to ensure overlay is fully gone
-            self.root.after(100)
+            # Capture the region
+            self.grab_async({"top": y1, "left": x1, "width": x2 - x1, "height": y2 - y1},
+                            self._on_region_grabbed)
 
-            # Capture the region using mss
-            with mss.mss() as sct:
-                monitor = {"top": y1, "left": x1, "width": x2 - x1, "height": y2 - y1}
-                screenshot = sct.grab(monitor)
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+        except Exception as e:
+            error_msg = f"Error capturing region: {e}"
+            self.status_var.set(error_msg)
+            print(error_msg)
+            messagebox.showerror("Error", error_msg)
+
+    def _on_region_grabbed(self, future):
+        """Called on the Tk thread once the region grab finishes"""
+        try:
+            img, prepared = future.result()
 
             # Open editor or save directly
             if self.edit_before_save.get():
                 self.status_var.set("Edit screenshot (add highlights, then Save or Cancel)")
-                ScreenshotEditor(img, self.on_editor_complete)
+                ScreenshotEditor(img, self.on_editor_complete, prepared)
             else:
                 self.save_screenshot(img)
 
@@ -1578,12 +2582,12 @@ class ScreenshotTool:
         if delay > 0:
             # Start countdown, then capture
             self.status_var.set(f"Countdown: {delay} seconds - set up your screen!")
-            self.root.iconify()
-            self.root.after(200, lambda: DelayCountdown(delay, self._on_fullscreen_delay_complete))
+            self.root.withdraw()
+            DelayCountdown(delay, self._on_fullscreen_delay_complete)
         else:
             # No delay - hide window briefly then capture
-            self.root.iconify()
-            self.root.after(150, self._do_fullscreen_capture)
+            self.root.withdraw()
+            self.root.after(50, self._do_fullscreen_capture)
 
     def _on_fullscreen_delay_complete(self, proceed):
         """Called when fullscreen delay countdown finishes"""
@@ -1597,29 +2601,25 @@ class ScreenshotTool:
     def _do_fullscreen_capture(self):
         """Actually capture the fullscreen"""
         self._capture_in_progress = False  # Reset flag
-        try:
-            self.status_var.set("Capturing...")
-            self.root.update()
+        self.status_var.set("Capturing...")
 
-            # Brief delay to allow any UI to settle
-            self.root.after(100)
+        # Capture the screen (GDI BitBlt, faster than PIL)
+        self.grab_async(0, self._on_fullscreen_grabbed)  # Monitor 0 = all monitors combined
 
-            # Capture the screen using mss (faster than PIL)
-            with mss.mss() as sct:
-                # Capture all monitors
-                screenshot = sct.grab(sct.monitors[0])  # Monitor 0 = all monitors combined
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+    def _on_fullscreen_grabbed(self, future):
+        """Called on the Tk thread once the fullscreen grab finishes"""
+        try:
+            img, prepared = future.result()
 
             # Open editor or save directly
             if self.edit_before_save.get():
                 # Editor needs window visible
                 self.root.deiconify()
                 self.status_var.set("Edit screenshot (add highlights, then Save or Cancel)")
-                ScreenshotEditor(img, self.on_editor_complete)
+                ScreenshotEditor(img, self.on_editor_complete, prepared)
             else:
                 # Only restore window if not in silent capture mode
-                if not self.silent_capture.get():
-                    self.root.deiconify()
+                self.restore_after_capture()
                 self.save_screenshot(img)
 
         except Exception as e:
@@ -1652,62 +2652,104 @@ class ScreenshotTool:
             save_dir = self.save_dir
         filepath = save_dir / filename
 
-        # Save the image
-        img.save(str(filepath), "PNG")
+        # Copy to clipboard and save on the I/O thread - PNG encoding a large
+        # screen takes long enough to visibly freeze the UI. Clipboard first, as its
+        # own step: packing the DIB is a fraction of the PNG encode, so the shot can
+        # be flashed and pasted while the file is still being written.
+        self.status_var.set(f"Saving {filename}...")
+        copied = self.io_executor.submit(self.copy_to_clipboard, img)
+        self.poll_future(copied, lambda f: self.on_screenshot_copied())
+        written = self.io_executor.submit(self.write_screenshot, img, filepath)
+        self.poll_future(written, lambda f: self.on_screenshot_written(f, img, filepath))
+
+    def write_screenshot(self, img, filepath):
+        """Save a screenshot as PNG (runs on the I/O thread)"""
+        # Fastest zlib level - on flat UI content it also comes out smaller than the
+        # default 6, which spends its time on filters that don't pay off here
+        img.save(str(filepath), "PNG", compress_level=1)
+
+    def on_screenshot_copied(self):
+        """Signal the capture and auto-send it as soon as it's on the clipboard"""
+        # Flash effect / notification
+        self.flash_notification()
+        print("Image copied to clipboard - ready to paste!")
 
-        # Copy to clipboard for easy pasting
-        self.copy_to_clipboard(img)
+        # Auto-send to target if enabled - pasting only needs the clipboard
+        if self.auto_send_enabled.get():
+            target_name = self.auto_send_target.get()
+            target = next((t for t in self.push_targets if t['name'] == target_name), None)
+            if target:
+                self.root.after_idle(lambda: self.paste_to_target(target))
+
+    def on_screenshot_written(self, future, img, filepath):
+        """Update the UI once a screenshot is on disk"""
+        filename = filepath.name
+        try:
+            future.result()
+        except Exception as e:
+            error_msg = f"Error saving screenshot: {e}"
+            self.status_var.set(error_msg)
+            print(error_msg)
+            messagebox.showerror("Error", error_msg)
+            return
+
+        # Count the new file into the cached folder size instead of rescanning for
+        # it (its size wasn't final yet when its creation bumped the folder mtime).
+        # Only if the cache predates the file - a rescan during the write has
+        # already counted part of it, so then the next call rescans instead.
+        # Saves into a subfolder don't change the total at all.
+        cache = self.disk_usage_cache
+        if cache is not None and filepath.parent == self.save_dir:
+            try:
+                st = filepath.stat()
+                # Creation time on Windows (ctime elsewhere is later, which only
+                # errs towards rescanning)
+                created = getattr(st, 'st_birthtime_ns', st.st_ctime_ns)
+                if cache[0] < created:
+                    self.disk_usage_cache = (self.save_dir.stat().st_mtime_ns,
+                                             cache[1] + st.st_size)
+                else:
+                    self.disk_usage_cache = None
+            except OSError:
+                self.disk_usage_cache = None
 
         # Update counter
         self.screenshot_count += 1
         self.counter_var.set(f"Screenshots this session: {self.screenshot_count}")
 
         # Update status
-        folder_info = f" [{self.current_folder}]" if self.current_folder else ""
+        folder_info = f" [{filepath.parent.name}]" if filepath.parent != self.save_dir else ""
         self.status_var.set(f"Saved{folder_info} & copied: {filename}")
 
         # Refresh gallery
         self.refresh_gallery()
 
-        # Flash effect / notification
-        self.flash_notification()
-
         # Show toast notification
         self.show_toast_notification(img, filename)
 
         print(f"Screenshot saved: {filepath}")
-        print("Image copied to clipboard - ready to paste!")
-
-        # Auto-send to target if enabled
-        if self.auto_send_enabled.get():
-            target_name = self.auto_send_target.get()
-            target = next((t for t in self.push_targets if t['name'] == target_name), None)
-            if target:
-                self.root.after(200, lambda: self.paste_to_target(target))
 
     def copy_to_clipboard(self, img):
         """Copy image to Windows clipboard using pywin32"""
-        import io
         import win32clipboard
 
         try:
-            # Convert to RGB if necessary
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-
-            # Save as BMP to memory
-            output = io.BytesIO()
-            img.save(output, 'BMP')
-            bmp_data = output.getvalue()
-            output.close()
-
-            # Skip BMP file header (14 bytes) to get DIB data
-            dib_data = bmp_data[14:]
+            # Transparent images also go up as straight BGRA for apps that read alpha -
+            # opaque captures stay 24-bit only, a quarter smaller
+            blocks = [(win32clipboard.CF_DIB, image_to_dib(img))]
+            if has_alpha(img):
+                blocks.append((win32clipboard.CF_DIBV5, image_to_dibv5(img)))
 
             # Use win32clipboard (much more reliable than ctypes)
             win32clipboard.OpenClipboard()
             win32clipboard.EmptyClipboard()
-            win32clipboard.SetClipboardData(win32clipboard.CF_DIB, dib_data)
+            for fmt, parts in blocks:
+                handle = clipboard_memory(*parts)
+                try:
+                    win32clipboard.SetClipboardData(fmt, handle)
+                except Exception:
+                    free_clipboard_memory(handle)  # Only ours until the clipboard accepts it
+                    raise
             win32clipboard.CloseClipboard()
         except Exception as e:
             print(f"Clipboard error (image still saved): {e}")
@@ -1790,7 +2832,8 @@ class ScreenshotTool:
                 'auto_send_enabled': self.auto_send_enabled.get(),
                 'auto_send_target': self.auto_send_target.get(),
                 'edit_before_save': self.edit_before_save.get(),
-                'silent_capture': self.silent_capture.get()
+                'silent_capture': self.silent_capture.get(),
+                'sharp_thumbnails': self.sharp_thumbnails.get()
             }
             with open(self.config_file, 'w') as f:
                 json.dump(config, f, indent=2)
@@ -1801,35 +2844,47 @@ class ScreenshotTool:
         """Paste clipboard content to a registered target application"""
         try:
             import win32gui
-            import win32con
-
-            # Find window by title pattern - search all windows
-            hwnd = None
-            target_pattern = target['title_pattern'].lower()
-
-            # Support multiple patterns separated by "|"
-            patterns = [p.strip() for p in target_pattern.split('|')]
-
-            def enum_callback(h, results):
-                if win32gui.IsWindowVisible(h):
-                    title = win32gui.GetWindowText(h).lower()
-                    # Check if any pattern matches
-                    for pattern in patterns:
-                        if pattern in title:
-                            results.append(h)
-                            return True
-                return True
-
-            results = []
-            win32gui.EnumWindows(enum_callback, results)
-
-            if not results:
-                self.status_var.set(f"'{target['name']}' window not found")
-                return False
+            import pywintypes
+
+            # Find window by title pattern - multiple patterns separated by "|",
+            # matched as plain substrings in one case-insensitive regex search
+            patterns = [p.strip() for p in target['title_pattern'].split('|')]
+            title_re = re.compile('|'.join(re.escape(p) for p in patterns), re.IGNORECASE)
+
+            def title_matches(h):
+                return title_re.search(win32gui.GetWindowText(h)) is not None
+
+            # Reuse the window found last time if it's still there and still matches -
+            # saves a GetWindowText round-trip to every top-level window per paste
+            hwnd = self.target_hwnds.get(target['name'])
+            if not (hwnd and win32gui.IsWindow(hwnd) and win32gui.IsWindowVisible(hwnd)
+                    and title_matches(hwnd)):
+                def enum_callback(h, results):
+                    # Visibility check first - it's cheaper than reading the title
+                    if win32gui.IsWindowVisible(h) and title_matches(h):
+                        results.append(h)
+                        return False  # Topmost match wins - stop enumerating
+                    return True
+
+                # Search all windows
+                results = []
+                try:
+                    win32gui.EnumWindows(enum_callback, results)
+                except pywintypes.error:
+                    # Stopping early makes EnumWindows return FALSE, which
+                    # pywin32 raises - only a real failure if nothing was found
+                    if not results:
+                        raise
 
-            hwnd = results[0]
+                if not results:
+                    self.status_var.set(f"'{target['name']}' window not found")
+                    return False
+
+                hwnd = results[0]
+                self.target_hwnds[target['name']] = hwnd
 
             # Move target window to CURRENT desktop if pyvda is available
+            moved = False
             if PYVDA_AVAILABLE:
                 try:
                     current_desktop = VirtualDesktop.current()
@@ -1838,19 +2893,47 @@ class ScreenshotTool:
                     # Only move if on a different desktop
                     if target_desktop and target_desktop != current_desktop:
                         target_view.move(current_desktop)
-                        time.sleep(0.15)  # Give move time to complete
+                        moved = True
                 except Exception as e:
                     print(f"Move to current desktop failed (continuing anyway): {e}")
 
-            # Restore if minimized
-            if win32gui.IsIconic(hwnd):
-                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                time.sleep(0.1)
+            # The rest runs off the event loop so Tk stays responsive while the target activates
+            if moved:
+                self.root.after(150, lambda: self._activate_target(target, hwnd))  # Give move time to complete
+            else:
+                self._activate_target(target, hwnd)
+            return True
 
+        except Exception as e:
+            self.status_var.set(f"Paste to {target['name']} failed: {e}")
+            print(f"Paste error: {e}")
+            return False
+
+    def _activate_target(self, target, hwnd):
+        """Bring the target window forward, then wait for it to take focus"""
+        try:
             # Bring window to foreground - use robust method
             self._force_foreground_window(hwnd)
+            self._wait_for_focus(target, hwnd, time.monotonic() + 0.5)
+        except Exception as e:
+            self.status_var.set(f"Paste to {target['name']} failed: {e}")
+            print(f"Paste error: {e}")
+
+    def _wait_for_focus(self, target, hwnd, deadline):
+        """Poll until the target is the foreground window, then paste"""
+        import win32gui
+
+        if win32gui.GetForegroundWindow() != hwnd:
+            if time.monotonic() < deadline:
+                self.root.after(10, lambda: self._wait_for_focus(target, hwnd, deadline))
+                return
+            print(f"'{target['name']}' didn't take focus in time (pasting anyway)")
+        self._click_target(target, hwnd)
 
-            time.sleep(0.2)
+    def _click_target(self, target, hwnd):
+        """Click the target's input position if it has one, then paste"""
+        try:
+            import win32gui
 
             # Click at position if specified
             if target.get('click_x') is not None and target.get('click_y') is not None:
@@ -1868,18 +2951,22 @@ class ScreenshotTool:
                     click_x = win_x + target['click_x']
                     click_y = win_y + target['click_y']
 
-                pyautogui.click(click_x, click_y)
-                time.sleep(0.1)
+                click_at(click_x, click_y)
+                self.root.after(20, lambda: self._paste_into_target(target))
+            else:
+                self._paste_into_target(target)
+        except Exception as e:
+            self.status_var.set(f"Paste to {target['name']} failed: {e}")
+            print(f"Paste error: {e}")
 
-            # Paste
-            pyautogui.hotkey('ctrl', 'v')
+    def _paste_into_target(self, target):
+        """Send Ctrl+V to the focused target"""
+        try:
+            send_ctrl_v()
             self.status_var.set(f"Pasted to {target['name']}!")
-            return True
-
         except Exception as e:
             self.status_var.set(f"Paste to {target['name']} failed: {e}")
             print(f"Paste error: {e}")
-            return False
 
     def _force_foreground_window(self, hwnd):
         """Force a window to foreground by clicking on it"""
@@ -1890,7 +2977,6 @@ class ScreenshotTool:
             # Restore if minimized
             if win32gui.IsIconic(hwnd):
                 win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                time.sleep(0.1)
 
             # Get window rectangle
             rect = win32gui.GetWindowRect(hwnd)
@@ -1900,8 +2986,7 @@ class ScreenshotTool:
             center_y = (rect[1] + rect[3]) // 2
 
             # Move mouse and click to activate window
-            pyautogui.click(center_x, center_y)
-            time.sleep(0.15)
+            click_at(center_x, center_y)
 
         except Exception as e:
             print(f"Foreground switch error: {e}")
@@ -1916,7 +3001,7 @@ class ScreenshotTool:
             # Find target
             target = next((t for t in self.push_targets if t['name'] == target_name), None)
             if target:
-                self.root.after(100, lambda: self.paste_to_target(target))
+                self.root.after_idle(lambda: self.paste_to_target(target))
         except Exception as e:
             self.status_var.set(f"Send failed: {e}")
 
@@ -2027,14 +3112,14 @@ class ScreenshotTool:
                 rect = win32gui.GetWindowRect(hwnd)
 
                 # Get mouse position
-                mouse_x, mouse_y = pyautogui.position()
+                mouse_x, mouse_y = win32gui.GetCursorPos()
 
                 # Calculate offset from window top-left
                 offset_x = mouse_x - rect[0]
                 offset_y = mouse_y - rect[1]
 
                 # Unregister hotkey
-                keyboard.remove_hotkey('ctrl+shift+t')
+                self.stop_target_hotkey()
 
                 # Show dialog to name the target
                 self.root.deiconify()
@@ -2046,7 +3131,16 @@ class ScreenshotTool:
                 print(f"Capture error: {e}")
                 self.root.deiconify()
 
-        keyboard.add_hotkey('ctrl+shift+t', on_capture)
+        # Hotkey callbacks run on the listener thread - hand this one to Tk
+        # An earlier attempt that was never completed still holds the hotkey
+        self.stop_target_hotkey()
+        self.target_hotkey = HotkeyListener({'ctrl+shift+t': lambda: self.root.after(0, on_capture)})
+        if self.target_hotkey.start():
+            # Nothing would ever end the wait - don't leave the window minimized on it
+            self.stop_target_hotkey()
+            self.root.deiconify()
+            self.status_var.set("Warning: Ctrl+Shift+T is in use elsewhere - target not added")
+            return
 
     def finish_target_registration(self, window_title, offset_x, offset_y, on_complete=None):
         """Complete the target registration with a name dialog"""
@@ -2116,7 +3210,7 @@ class ScreenshotTool:
             return  # User cancelled
 
         try:
-            # Load the image
+            # Load the image (no draft() - imports are saved at full resolution)
             img = Image.open(filepath)
 
             # Convert to RGB if necessary (for consistency)
@@ -2139,7 +3233,6 @@ class ScreenshotTool:
 
     def paste_from_clipboard(self):
         """Import an image from the clipboard"""
-        from PIL import ImageGrab
 
         try:
             # Try to get image from clipboard
@@ -2181,10 +3274,11 @@ class ScreenshotTool:
 
     def flash_notification(self):
         # Brief visual flash to confirm capture (only if main window visible)
+        # A strip laid over the top edge - recolouring the root repainted the whole window
         if self.root.state() != 'withdrawn':
-            original_bg = self.root.cget("bg")
-            self.root.configure(bg="green")
-            self.root.after(100, lambda: self.root.configure(bg=original_bg))
+            self.flash_strip.place(x=0, y=0, relwidth=1)
+            self.flash_strip.lift()
+            self.root.after(100, self.flash_strip.place_forget)
 
     def show_toast_notification(self, img, filename):
         """Show a toast notification in bottom-right corner with thumbnail preview"""
@@ -2204,8 +3298,13 @@ class ScreenshotTool:
 
         # Create thumbnail preview
         try:
-            thumb_img = img.copy()
-            thumb_img.thumbnail((60, 60), Image.Resampling.LANCZOS)
+            # Resized straight from the capture - thumbnail() works in place, so it
+            # needed a full-size copy of the screenshot first. The box reduce does
+            # most of the shrinking, and at 60px BILINEAR for the last <2x step looks
+            # the same as LANCZOS (as for gallery thumbnails)
+            fit = min(60 / img.width, 60 / img.height, 1)
+            thumb_img = img.resize((max(1, round(img.width * fit)), max(1, round(img.height * fit))),
+                                   Image.Resampling.BILINEAR, reducing_gap=2.0)
             thumb_photo = ImageTk.PhotoImage(thumb_img)
 
             # Store reference to prevent garbage collection
@@ -2292,6 +3391,7 @@ class ScreenshotTool:
                     self.auto_send_target.set(config.get('auto_send_target', ''))
                     self.edit_before_save.set(config.get('edit_before_save', True))
                     self.silent_capture.set(config.get('silent_capture', False))
+                    self.sharp_thumbnails.set(config.get('sharp_thumbnails', False))
         except Exception as e:
             print(f"Error loading settings: {e}")
 
@@ -2303,7 +3403,6 @@ class ScreenshotTool:
         if not PYVDA_AVAILABLE:
             # Try to install pyvda
             try:
-                print("Installing pyvda for virtual desktop support...")
                 install_package("pyvda")
                 from pyvda import AppView, VirtualDesktop
                 PYVDA_AVAILABLE = True
@@ -2379,22 +3478,85 @@ class ScreenshotTool:
         self.save_push_targets()
 
     def get_thumbnail_size(self):
-        """Calculate thumbnail size based on scale (1-10)"""
-        scale = self.thumbnail_scale.get()
-        base_width, base_height = 120, 90  # Default size at scale 5
-
-        # Scale 1 = 50% (0.5x), Scale 5 = 100% (1.0x), Scale 10 = 300% (3.0x)
-        if scale <= 5:
-            factor = 0.5 + (scale - 1) * 0.5 / 4
+        """Thumbnail size for the current scale setting (1-10)"""
+        # Clamped, as the setting comes back from the config file as saved
+        scale = min(max(self.thumbnail_scale.get(), 1), 10)
+        return THUMBNAIL_SIZES[scale - 1]
+
+    def load_thumbnail(self, path, size, sharp=False, mtime=None):
+        """Get a gallery thumbnail, regenerating the cached copy only if the image changed.
+        mtime is the image's, if the caller already has it from listing the folder."""
+        # .thumbs mirrors the folder layout so prune_thumbnails can map back to the source
+        # (freshness is the thumbnail's own mtime, so an edit overwrites it in place).
+        # One read of thumb_dir, so a save folder change mid-load can't mix two roots
+        thumb_dir = self.thumb_dir
+        try:
+            rel = path.relative_to(thumb_dir.parent)
+        except ValueError:
+            thumb_path = None  # Queued before the save folder changed - don't cache it
         else:
-            factor = 1.0 + (scale - 5) * 2.0 / 5
+            suffix = "s" if sharp else ""
+            thumb_path = thumb_dir / rel.parent / f"{rel.stem}_{size[0]}x{size[1]}{suffix}.jpg"
+        try:
+            if mtime is None:
+                mtime = path.stat().st_mtime
+            if thumb_path is not None and thumb_path.stat().st_mtime >= mtime:
+                img = Image.open(thumb_path)
+                img.load()  # Decode here, not lazily on the Tk thread
+                return img
+        except OSError:
+            pass  # Not cached yet
+
+        img = Image.open(path)
+        # thumbnail() box-reduces to within 2x of the target first, so BILINEAR
+        # for the last step looks the same at preview size and is much cheaper
+        # (it also calls draft() for JPEGs itself)
+        img.thumbnail(size, Image.Resampling.LANCZOS if sharp else Image.Resampling.BILINEAR)
+        img = img.convert('RGB')
+        if thumb_path is None:
+            return img
+        try:
+            thumb_path.parent.mkdir(exist_ok=True)
+            # Plain baseline JPEG - optimize/progressive add extra passes over the
+            # coefficients for a few percent of size on a file this small
+            img.save(thumb_path, "JPEG", quality=85, optimize=False, progressive=False)
+        except OSError as e:
+            print(f"Could not cache thumbnail: {e}")
+        return img
+
+    def prune_thumbnails(self, save_dir, thumb_dir):
+        """Delete cached thumbnails whose screenshot was deleted or moved (runs on the I/O thread).
+        Takes the folder and its cache together, as the save folder can change meanwhile."""
+        # One listing per folder instead of an exists() call per cached thumbnail
+        # (lowercased - Windows names are case-insensitive)
+        folder_names = {}
+        for thumb_path in thumb_dir.rglob("*.jpg"):
+            rel = thumb_path.relative_to(thumb_dir)
+            names = folder_names.get(rel.parent)
+            if names is None:
+                names = folder_names[rel.parent] = {
+                    path.name.lower() for _, path in list_images(save_dir / rel.parent)}
+            stem = rel.stem.rsplit('_', 1)[0]  # Drop the _WxH size suffix
+            if f"{stem}.png".lower() not in names:
+                try:
+                    thumb_path.unlink()
+                except OSError:
+                    pass
 
-        return (int(base_width * factor), int(base_height * factor))
+    def screenshot_bytes(self):
+        """Total size of the screenshots in the save folder, rescanned only when its listing changed"""
+        # Creating, deleting or moving a file bumps the folder's mtime. Writing into
+        # one doesn't, so on_screenshot_written counts a save in once it lands.
+        mtime = self.save_dir.stat().st_mtime_ns
+        if self.disk_usage_cache is None or self.disk_usage_cache[0] != mtime:
+            total = sum(entry.stat().st_size for entry in screenshot_entries(self.save_dir))
+            self.disk_usage_cache = (mtime, total)
+        return self.disk_usage_cache[1]
 
     def update_disk_usage(self, show_warning=True):
         """Calculate and display total size of screenshots with color coding"""
         try:
-            total_bytes = sum(f.stat().st_size for f in self.save_dir.glob("screenshot_*.png"))
+            total_bytes = self.screenshot_bytes()
             limit_bytes = self.disk_limit_mb.get() * 1024 * 1024
             usage_percent = (total_bytes / limit_bytes * 100) if limit_bytes > 0 else 0
 
@@ -2449,16 +3611,32 @@ class ScreenshotTool:
         import datetime
         days = self.archive_days.get()
         cutoff = datetime.datetime.now() - datetime.timedelta(days=days)
+
+        # Hundreds of unlinks can take seconds, so they run on the I/O thread (after
+        # any queued saves). One thread is enough - deletes in the same folder
+        # serialize on the directory anyway.
+        self.status_var.set("Cleaning up old screenshots...")
+        future = self.io_executor.submit(self.delete_screenshots_before, cutoff.timestamp())
+        self.poll_future(future, lambda f: self.on_cleanup_done(f, days))
+
+    def delete_screenshots_before(self, cutoff):
+        """Delete root screenshots last modified before the cutoff timestamp (runs on
+        the I/O thread). Returns (files deleted, bytes freed)."""
         deleted_count = 0
         deleted_bytes = 0
-
+        for entry in screenshot_entries(self.save_dir):
+            stat = entry.stat()  # From the listing - no per-file stat call
+            if stat.st_mtime < cutoff:
+                deleted_bytes += stat.st_size
+                os.unlink(entry.path)
+                deleted_count += 1
+        return deleted_count, deleted_bytes
+
+    def on_cleanup_done(self, future, days):
+        """Report a finished cleanup and refresh what it changed"""
+        self.status_var.set("Ready")
         try:
-            for f in self.save_dir.glob("screenshot_*.png"):
-                file_time = datetime.datetime.fromtimestamp(f.stat().st_mtime)
-                if file_time < cutoff:
-                    deleted_bytes += f.stat().st_size
-                    f.unlink()
-                    deleted_count += 1
+            deleted_count, deleted_bytes = future.result()
 
             if deleted_count > 0:
                 size_mb = deleted_bytes / (1024 * 1024)
@@ -2469,6 +3647,7 @@ class ScreenshotTool:
                 )
                 self._cleanup_prompted = False  # Allow future prompts
                 self.refresh_gallery()
+                self.io_executor.submit(self.prune_thumbnails, self.save_dir, self.thumb_dir)
             else:
                 messagebox.showinfo(
                     "Cleanup Complete",
@@ -2508,11 +3687,12 @@ class ScreenshotTool:
         for widget in self.folder_buttons_frame.winfo_children():
             widget.destroy()
         self.folder_drop_targets = {}
+        self.folder_button_names = {}  # widget path -> folder name (None = All)
 
-        # Store thumbnail references to prevent garbage collection
-        if not hasattr(self, 'folder_preview_images'):
-            self.folder_preview_images = []
-        self.folder_preview_images.clear()
+        # Store thumbnail references to prevent garbage collection - screenshot
+        # path -> (mtime, photo), with last rebuild's reused where unchanged
+        self.folder_preview_cache = getattr(self, 'folder_preview_images', {})
+        self.folder_preview_images = {}
 
         # "All" button (also a drop target for root)
         all_frame = self.create_folder_button_with_preview(None, "All")
@@ -2522,6 +3702,7 @@ class ScreenshotTool:
         for folder in self.get_folders():
             folder_frame = self.create_folder_button_with_preview(folder, folder)
             folder_frame.pack(side=tk.LEFT, padx=(0, 8))
+        self.folder_preview_cache = {}
 
     def create_folder_button_with_preview(self, folder_name, display_name):
         """Create a folder button with thumbnail previews"""
@@ -2549,8 +3730,8 @@ class ScreenshotTool:
 
             # Get first 3 images
             images = sorted(
-                search_dir.glob("*.png"),
-                key=lambda x: x.stat().st_mtime,
+                list_images(search_dir),
+                key=lambda x: x[0],
                 reverse=True
             )[:3]
 
@@ -2559,12 +3740,17 @@ class ScreenshotTool:
                 preview_frame = tk.Frame(btn_frame, bg='#4a90d9' if is_selected else '#f5f5f5', cursor='hand2')
                 preview_frame.pack(pady=(4, 2))
 
-                for img_path in images:
+                for mtime, img_path in images:
                     try:
-                        img = Image.open(img_path)
-                        img.thumbnail((30, 30), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        self.folder_preview_images.append(photo)
+                        # The folder bar is rebuilt on every refresh, so reuse the last
+                        # photo when the screenshot is unchanged, else go to the .thumbs cache
+                        cached = self.folder_preview_cache.get(img_path)
+                        if cached and cached[0] == mtime:
+                            photo = cached[1]
+                        else:
+                            img = self.load_thumbnail(img_path, (30, 30), sharp=True, mtime=mtime)
+                            photo = ImageTk.PhotoImage(img)
+                        self.folder_preview_images[img_path] = (mtime, photo)
 
                         lbl = tk.Label(preview_frame, image=photo, bg='#4a90d9' if is_selected else '#f5f5f5', cursor='hand2')
                         lbl.pack(side=tk.LEFT, padx=1)
@@ -2584,34 +3770,33 @@ class ScreenshotTool:
         )
         name_label.pack(pady=(2, 4), padx=8)
 
-        # Click handlers for the entire frame
-        def on_click(e):
-            self.select_folder(folder_name)
-
-        # Bind click to all widgets in the button
+        # Clicks (and the context menu) anywhere on the button - its frame, name
+        # label and preview thumbnails - go through the FolderButton tag
+        widgets = [btn_frame]
         for widget in btn_frame.winfo_children():
-            widget.bind("<Button-1>", on_click)
-            if folder_name:
-                widget.bind("<Button-3>", lambda e: self.show_folder_menu(e, folder_name))
-            # Also bind to children (preview thumbnails)
-            for child in widget.winfo_children():
-                child.bind("<Button-1>", on_click)
-                if folder_name:
-                    child.bind("<Button-3>", lambda e: self.show_folder_menu(e, folder_name))
-
-        btn_frame.bind("<Button-1>", on_click)
-        name_label.bind("<Button-1>", on_click)
-
-        # Right-click context menu
-        if folder_name:
-            btn_frame.bind("<Button-3>", lambda e: self.show_folder_menu(e, folder_name))
-            name_label.bind("<Button-3>", lambda e: self.show_folder_menu(e, folder_name))
+            widgets.append(widget)
+            widgets.extend(widget.winfo_children())
+        for widget in widgets:
+            tags = widget.bindtags()
+            widget.bindtags(tags[:1] + ("FolderButton",) + tags[1:])
+            self.folder_button_names[str(widget)] = folder_name
 
         # Register as drop target
         self.folder_drop_targets[folder_name] = btn_frame
 
         return container
 
+    def on_folder_click(self, event):
+        """Show the folder whose button was clicked"""
+        if str(event.widget) in self.folder_button_names:
+            self.select_folder(self.folder_button_names[str(event.widget)])
+
+    def on_folder_menu(self, event):
+        """Open the context menu for a folder button (not for "All")"""
+        folder_name = self.folder_button_names.get(str(event.widget))
+        if folder_name:
+            self.show_folder_menu(event, folder_name)
+
     def select_folder(self, folder_name):
         """Select a folder to filter gallery"""
         self.current_folder = folder_name
@@ -2919,13 +4104,6 @@ class ScreenshotTool:
         try:
             # Update disk usage display
             self.update_disk_usage()
-
-            # Clear existing thumbnails
-            for widget in self.gallery_frame.winfo_children():
-                try:
-                    widget.destroy()
-                except:
-                    pass
         except Exception as e:
             print(f"Error in refresh_gallery start: {e}")
             return
@@ -2934,28 +4112,23 @@ class ScreenshotTool:
         try:
             if self.current_folder:
                 # Show only images in selected folder
-                search_dir = self.save_dir / self.current_folder
-                screenshots = sorted(
-                    search_dir.glob("*.png"),
-                    key=lambda x: x.stat().st_mtime,
-                    reverse=True
-                )[:30]
+                all_images = list_images(self.save_dir / self.current_folder)
             else:
                 # Show all images (root + subfolders)
-                all_images = list(self.save_dir.glob("*.png"))
-                # Also include images from subfolders
-                for folder in self.get_folders():
-                    all_images.extend((self.save_dir / folder).glob("*.png"))
-                screenshots = sorted(
-                    all_images,
-                    key=lambda x: x.stat().st_mtime,
-                    reverse=True
-                )[:30]
+                all_images = list_images(self.save_dir,
+                                         *(self.save_dir / folder for folder in self.get_folders()))
+            screenshots = sorted(
+                all_images,
+                key=lambda x: x[0],
+                reverse=True
+            )[:30]
         except Exception as e:
             print(f"Error reading screenshots: {e}")
             screenshots = []
 
         if not screenshots:
+            self.clear_gallery()
+            self.thumb_photos = {}
             no_images_label = ttk.Label(
                 self.gallery_frame,
                 text="No screenshots yet. Press Ctrl+Shift+R to capture a region!"
@@ -2963,119 +4136,222 @@ class ScreenshotTool:
             no_images_label.pack(pady=20)
             return
 
-        # Store references to prevent garbage collection
-        self.thumbnail_images = []
-
         # Calculate thumbnails per row based on size
-        thumb_width = self.get_thumbnail_size()[0]
+        thumb_size = self.get_thumbnail_size()
+        thumb_width = thumb_size[0]
         gallery_width = 560  # Approximate usable width
         thumbs_per_row = max(1, gallery_width // (thumb_width + 15))
 
-        # Create thumbnail grid
-        row_frame = None
-        for i, screenshot_path in enumerate(screenshots):
-            if i % thumbs_per_row == 0:
-                row_frame = tk.Frame(self.gallery_frame, bg='#f5f5f5')
-                row_frame.pack(fill=tk.X, pady=5)
-
+        # Existing cells are reused in place unless the grid shape changed (or the
+        # gallery is showing the "no screenshots" label instead)
+        if thumbs_per_row != self.thumb_layout or not self.thumb_cells:
+            self.clear_gallery()
+            self.thumb_layout = thumbs_per_row
+
+        # Same files at the same size as last time (e.g. a save into a folder not
+        # being shown, or a settings change that doesn't touch thumbnails) - the
+        # grid is already right, so don't re-point every cell
+        sharp = self.sharp_thumbnails.get()  # Tk variables must be read on this thread
+        state = (screenshots, thumb_size, sharp)
+        if state == self.gallery_state:
+            return
+        self.gallery_state = state
+
+        # Only decode/resize thumbnails that aren't already on screen at this size -
+        # in parallel, as Pillow releases the GIL while decoding and resampling.
+        # Tk widgets are still only built on this thread.
+        self.gallery_generation += 1
+        thumb_keys = {}
+        thumb_futures = {}
+        for mtime, path in screenshots:
+            thumb_keys[path] = (mtime, thumb_size, sharp)
+            cached = self.thumb_photos.get(path)
+            if not cached or cached[0] != thumb_keys[path]:
+                thumb_futures[path] = self.thumb_executor.submit(self.load_thumbnail, path, thumb_size,
+                                                                 sharp, mtime)
+
+        # Fill the grid in order, re-pointing existing labels and adding any missing.
+        # Thumbnails still decoding get their old picture (or a blank) for now and
+        # are swapped in by poll_thumbnails, so the Tk thread never waits on a decode.
+        # The blank is kept between refreshes, like the thumbnails - a new Tk image
+        # per refresh would be created (and mostly thrown away) every time
+        if self.thumb_placeholder is None or self.thumb_placeholder[0] != thumb_size:
+            self.thumb_placeholder = (thumb_size, tk.PhotoImage(width=thumb_size[0], height=thumb_size[1]))
+        placeholder = self.thumb_placeholder[1]
+        pending = []
+        photos = {}
+        self.thumb_paths = {}
+        count = 0
+        for _, screenshot_path in screenshots:
+            key = thumb_keys[screenshot_path]
+            future = thumb_futures.get(screenshot_path)
             try:
-                # Create thumbnail container
-                thumb_frame = tk.Frame(row_frame, bg='white')
-                thumb_frame.pack(side=tk.LEFT, padx=5)
-
-                # Load and resize image based on thumbnail scale
-                img = Image.open(screenshot_path)
-                thumb_size = self.get_thumbnail_size()
-                img.thumbnail(thumb_size, Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.thumbnail_images.append(photo)
-
-                # Create container for image and overlay
-                img_container = tk.Frame(thumb_frame, bg='white')
-                img_container.pack()
-
-                # Create clickable thumbnail with drag support
-                thumb_label = tk.Label(img_container, image=photo, cursor="hand2", bg='white')
-                thumb_label.pack()
-
-                # Drag and drop bindings
-                def make_drag_handlers(path, img_photo):
-                    drag_started = [False]
-                    start_pos = [0, 0]
-
-                    def on_press(e):
-                        start_pos[0] = e.x_root
-                        start_pos[1] = e.y_root
-                        drag_started[0] = False
-
-                    def on_motion(e):
-                        # Start drag if moved more than 5 pixels
-                        if not drag_started[0]:
-                            dx = abs(e.x_root - start_pos[0])
-                            dy = abs(e.y_root - start_pos[1])
-                            if dx > 5 or dy > 5:
-                                drag_started[0] = True
-                                self.start_drag(e, path, img_photo)
-                        else:
-                            self.do_drag(e)
-
-                    def on_release(e):
-                        if drag_started[0]:
-                            self.end_drag(e)
-                        else:
-                            self.open_image(path)
-
-                    return on_press, on_motion, on_release
-
-                press_h, motion_h, release_h = make_drag_handlers(screenshot_path, photo)
-                thumb_label.bind("<Button-1>", press_h)
-                thumb_label.bind("<B1-Motion>", motion_h)
-                thumb_label.bind("<ButtonRelease-1>", release_h)
-
-                # Right-click context menu
-                def show_context_menu(e, path):
-                    menu = tk.Menu(self.root, tearoff=0)
-                    menu.add_command(label="Open", command=lambda: self.open_image(path))
-                    menu.add_command(label="Edit", command=lambda: self.edit_screenshot(path))
-                    menu.add_command(label="Copy", command=lambda: self.copy_file_to_clipboard(path))
-                    menu.add_separator()
-
-                    # Send submenu
-                    send_menu = tk.Menu(menu, tearoff=0)
-                    for target in self.push_targets:
-                        if target.get('enabled', True):
-                            send_menu.add_command(
-                                label=target['name'],
-                                command=lambda p=path, t=target['name']: self.send_to_target(p, t)
-                            )
-                    menu.add_cascade(label="Send to", menu=send_menu)
-
-                    # Move submenu
-                    move_menu = tk.Menu(menu, tearoff=0)
-                    folders = self.get_folders()
-                    # Add "Root" option
-                    move_menu.add_command(
-                        label="📁 Root",
-                        command=lambda p=path: self.move_to_folder(p, None)
-                    )
-                    if folders:
-                        move_menu.add_separator()
-                    for folder in folders:
-                        move_menu.add_command(
-                            label=f"📁 {folder}",
-                            command=lambda p=path, f=folder: self.move_to_folder(p, f)
-                        )
-                    menu.add_cascade(label="Move to", menu=move_menu)
-
-                    menu.add_separator()
-                    menu.add_command(label="Delete", command=lambda: self.delete_screenshot(path))
-
-                    menu.post(e.x_root, e.y_root)
-
-                thumb_label.bind("<Button-3>", lambda e: show_context_menu(e, screenshot_path))
-
+                if future is None:
+                    photo = self.thumb_photos[screenshot_path][1]
+                elif future.done():
+                    # Thumbnail at the current thumbnail scale
+                    photo = ImageTk.PhotoImage(future.result())
+                else:
+                    old = self.thumb_photos.get(screenshot_path)
+                    photo = old[1] if old else placeholder
+                    key = None  # Not current yet - a refresh before it lands resubmits it
             except Exception as e:
                 print(f"Error loading thumbnail {screenshot_path}: {e}")
+                self.gallery_state = None  # Retry it on the next refresh
+                continue
+            # Store references to prevent garbage collection
+            photos[screenshot_path] = (key, photo)
+
+            if count < len(self.thumb_cells):
+                thumb_label = self.thumb_cells[count]
+                if thumb_label.cget('image') != str(photo):
+                    thumb_label.configure(image=photo)
+            else:
+                if count % thumbs_per_row == 0:
+                    row_frame = tk.Frame(self.gallery_frame, bg='#f5f5f5')
+                    row_frame.pack(fill=tk.X, pady=5)
+                    self.add_wheel_scrolling(row_frame)
+                    self.thumb_rows.append(row_frame)
+
+                # Create clickable thumbnail with drag support - packed straight into
+                # the row, as every wrapper frame is another native window to create
+                thumb_label = tk.Label(self.thumb_rows[-1], image=photo, cursor="hand2", bg='white')
+                thumb_label.pack(side=tk.LEFT, padx=5)
+                self.thumb_cells.append(thumb_label)
+
+                # Clicks, drags and the context menu come from the GalleryThumb tag.
+                # Tagged for the wheel here too, so only new widgets are touched -
+                # not the whole gallery tree after every refresh
+                tags = thumb_label.bindtags()
+                thumb_label.bindtags(tags[:1] + ("GalleryWheel", "GalleryThumb") + tags[1:])
+
+            self.thumb_paths[str(thumb_label)] = (screenshot_path, photo)
+            if key is None:
+                pending.append((thumb_label, screenshot_path, thumb_keys[screenshot_path], future))
+            count += 1
+
+        # Drop cells (and rows) left over from a longer list
+        for thumb_label in self.thumb_cells[count:]:
+            thumb_label.destroy()
+        del self.thumb_cells[count:]
+        rows_needed = (count + thumbs_per_row - 1) // thumbs_per_row
+        for row_frame in self.thumb_rows[rows_needed:]:
+            row_frame.destroy()
+        del self.thumb_rows[rows_needed:]
+        self.thumb_photos = photos
+
+        if pending:
+            self.poll_thumbnails(self.gallery_generation, pending)
+
+    def poll_thumbnails(self, generation, pending):
+        """Swap finished thumbnails into their cells, checking back until all have landed"""
+        if generation != self.gallery_generation:
+            return  # Refreshed (or cleared) since - those labels may be gone or reused
+        waiting = []
+        for thumb_label, path, key, future in pending:
+            if not future.done():
+                waiting.append((thumb_label, path, key, future))
+                continue
+            try:
+                photo = ImageTk.PhotoImage(future.result())
+            except Exception as e:
+                print(f"Error loading thumbnail {path}: {e}")
+                self.gallery_state = None  # Retry it on the next refresh
+                continue
+            thumb_label.configure(image=photo)
+            self.thumb_paths[str(thumb_label)] = (path, photo)
+            self.thumb_photos[path] = (key, photo)
+        if waiting:
+            self.root.after(10, lambda: self.poll_thumbnails(generation, waiting))
+
+    def clear_gallery(self):
+        """Destroy every gallery widget so the grid is rebuilt from scratch"""
+        for widget in self.gallery_frame.winfo_children():
+            try:
+                widget.destroy()
+            except:
+                pass
+        self.thumb_cells = []
+        self.thumb_rows = []
+        self.thumb_paths = {}
+        self.thumb_layout = None
+        self.gallery_state = None
+        self.gallery_generation += 1  # Orphan any thumbnails still decoding
+
+    def on_thumb_press(self, event):
+        """Remember where a thumbnail press started"""
+        self.thumb_press = (event.x_root, event.y_root)
+        self.thumb_dragging = False
+
+    def on_thumb_motion(self, event):
+        """Start or continue dragging a thumbnail"""
+        if self.thumb_dragging:
+            self.do_drag(event)
+            return
+        entry = self.thumb_paths.get(str(event.widget))
+        if entry is None:
+            return
+        # Start drag if moved more than 5 pixels
+        dx = abs(event.x_root - self.thumb_press[0])
+        dy = abs(event.y_root - self.thumb_press[1])
+        if dx > 5 or dy > 5:
+            self.thumb_dragging = True
+            self.start_drag(event, *entry)
+
+    def on_thumb_release(self, event):
+        """Drop a dragged thumbnail, or open it if it was just clicked"""
+        if self.thumb_dragging:
+            self.thumb_dragging = False
+            self.end_drag(event)
+            return
+        entry = self.thumb_paths.get(str(event.widget))
+        if entry is not None:
+            self.open_image(entry[0])
+
+    def show_thumb_menu(self, event):
+        """Right-click context menu for a thumbnail"""
+        entry = self.thumb_paths.get(str(event.widget))
+        if entry is None:
+            return
+        path = entry[0]
+
+        menu = tk.Menu(self.root, tearoff=0)
+        menu.add_command(label="Open", command=lambda: self.open_image(path))
+        menu.add_command(label="Edit", command=lambda: self.edit_screenshot(path))
+        menu.add_command(label="Copy", command=lambda: self.copy_file_to_clipboard(path))
+        menu.add_separator()
+
+        # Send submenu
+        send_menu = tk.Menu(menu, tearoff=0)
+        for target in self.push_targets:
+            if target.get('enabled', True):
+                send_menu.add_command(
+                    label=target['name'],
+                    command=lambda p=path, t=target['name']: self.send_to_target(p, t)
+                )
+        menu.add_cascade(label="Send to", menu=send_menu)
+
+        # Move submenu
+        move_menu = tk.Menu(menu, tearoff=0)
+        folders = self.get_folders()
+        # Add "Root" option
+        move_menu.add_command(
+            label="📁 Root",
+            command=lambda p=path: self.move_to_folder(p, None)
+        )
+        if folders:
+            move_menu.add_separator()
+        for folder in folders:
+            move_menu.add_command(
+                label=f"📁 {folder}",
+                command=lambda p=path, f=folder: self.move_to_folder(p, f)
+            )
+        menu.add_cascade(label="Move to", menu=move_menu)
+
+        menu.add_separator()
+        menu.add_command(label="Delete", command=lambda: self.delete_screenshot(path))
+
+        menu.post(event.x_root, event.y_root)
 
     def copy_file_to_clipboard(self, filepath):
         """Copy an existing image file to clipboard"""
@@ -3277,6 +4553,20 @@ class ScreenshotTool:
         size_label.pack(side=tk.LEFT)
         update_size_label()
 
+        # Sharper (slower to generate) thumbnails for high-DPI screens
+        def toggle_sharp_and_mark():
+            self.save_push_targets()
+            self.refresh_gallery()
+            mark_saved()
+
+        sharp_check = ttk.Checkbutton(
+            frame,
+            text="Sharp previews (slower)",
+            variable=self.sharp_thumbnails,
+            command=toggle_sharp_and_mark
+        )
+        sharp_check.pack(anchor=tk.W, pady=(0, 15))
+
         # Storage management section
         storage_frame = ttk.LabelFrame(frame, text="Storage Management", padding="10")
         storage_frame.pack(fill=tk.X, pady=(0, 15))
@@ -3382,6 +4672,14 @@ class ScreenshotTool:
         )
         if new_dir:
             self.save_dir = Path(new_dir)
+            self.disk_usage_cache = None
+            # The thumbnail cache lives in the save folder, and the in-memory
+            # thumbnails and previews are keyed by paths under the old one
+            self.thumb_dir = self.save_dir / ".thumbs"
+            self.thumb_dir.mkdir(exist_ok=True)
+            self.thumb_photos = {}
+            self.gallery_state = None
+            self.folder_preview_images = {}
             self.dir_var.set(str(self.save_dir))
             self.refresh_gallery()
             self.status_var.set(f"Save location changed to: {new_dir}")
@@ -3424,12 +4722,20 @@ class ScreenshotTool:
         """Clean up and close"""
         self.cleanup_floating_windows()
         self.unregister_hotkeys()
+        # Capture handles are per thread, so the capture thread releases its own
+        self.capture_executor.submit(release_capture)
+        self.capture_executor.shutdown(wait=False)
+        release_capture()
+        self.thumb_executor.shutdown(wait=False)
+        self.io_executor.shutdown(wait=True)  # Let queued saves finish
         self.root.destroy()
 
     def run(self):
         """Start the application"""
         print("Screenshot Tool started!")
         print(f"Screenshots will be saved to: {self.save_dir}")
+        print(f"Pillow {PIL.__version__}" + (" (SIMD build)" if PILLOW_SIMD else ""))
+        print("Capture: " + ("Desktop Duplication (bettercam), GDI fallback" if BETTERCAM_AVAILABLE else "GDI"))
         print(f"Hotkeys:")
         print(f"  {self.hotkey_region} - Capture region")
         print(f"  {self.hotkey_full} - Capture full screen")